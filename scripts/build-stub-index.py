@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Stub Index Generator
+
+Walks module directories for prompt.txt / examples/output.json pairs and
+bakes the 100-char prompt prefixes into a literal dict in
+src/cognitive/providers/_stub_index.py. The stub provider imports that
+dict when present, so matching a request needs no filesystem scanning
+or prompt parsing at runtime.
+
+Usage:
+    python scripts/build-stub-index.py [modules_dir ...]
+
+Defaults to ./cognitive/modules and ~/.cognitive/modules. Run as part of
+packaging or after adding modules; without the generated file the stub
+falls back to scanning at runtime.
+"""
+
+import sys
+from pathlib import Path
+
+
+def build_index(module_dirs: list) -> dict:
+    """Collect {prompt prefix: output path} pairs from module directories."""
+    index = {}
+    for base in module_dirs:
+        if not base.exists():
+            continue
+        for module_dir in sorted(base.iterdir()):
+            if not module_dir.is_dir():
+                continue
+            prompt_file = module_dir / "prompt.txt"
+            output_file = module_dir / "examples" / "output.json"
+            if prompt_file.exists() and output_file.exists():
+                prefix = prompt_file.read_text(encoding="utf-8")[:100]
+                index[prefix] = str(output_file)
+    return index
+
+
+def main() -> int:
+    if len(sys.argv) > 1:
+        module_dirs = [Path(arg) for arg in sys.argv[1:]]
+    else:
+        module_dirs = [
+            Path.cwd() / "cognitive" / "modules",
+            Path.home() / ".cognitive" / "modules",
+        ]
+
+    index = build_index(module_dirs)
+
+    target = Path(__file__).parent.parent / "src" / "cognitive" / "providers" / "_stub_index.py"
+    lines = [
+        '"""Generated by scripts/build-stub-index.py - do not edit."""',
+        "",
+        "STUB_INDEX = {",
+    ]
+    for prefix, path in index.items():
+        lines.append(f"    {prefix!r}: {path!r},")
+    lines.append("}")
+    lines.append("")
+    target.write_text("\n".join(lines), encoding="utf-8")
+
+    print(f"Wrote {len(index)} entries to {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""
+Entry point for ``python -m cognitive`` and the ``cog`` console script.
+
+Kept deliberately tiny: ``cog --version`` answers before typer/rich are
+imported, so scripts probing the CLI pay milliseconds instead of the full
+framework import.
+"""
+
+import sys
+
+
+def main() -> None:
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        from cognitive import __version__
+
+        print(f"cog version {__version__}")
+        raise SystemExit(0)
+
+    from cognitive.cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+JSON helpers - orjson-backed loads/dumps with a stdlib fallback.
+
+orjson parses and serialises JSON several times faster than the stdlib
+json module. It is optional (pip install orjson); without it the helpers
+fall back to the stdlib with identical semantics. orjson.JSONDecodeError
+subclasses json.JSONDecodeError, so existing except clauses keep working
+with either backend.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parse JSON from a str or bytes payload."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialise obj straight to UTF-8 bytes, skipping the str round-trip.
+
+    sort_keys=True yields a canonical form suitable for hashing.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialise obj to a JSON string, keeping non-ASCII characters as-is.
+
+    indent=True produces 2-space indentation (the only level orjson supports).
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
@@ -19,7 +19,6 @@ Commands:
     cogn mcp                       Start MCP server for Claude/Cursor
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Optional
@@ -27,44 +26,39 @@ from typing import Optional
 import typer
 from rich import print as rprint
 from rich.console import Console
-from rich.table import Table
 
 from . import __version__
-from .registry import (
-    list_modules,
-    find_module,
-    install_module,
-    uninstall_module,
-    search_registry,
-    fetch_registry,
-    install_from_github_url,
-    update_module,
-    get_installed_module_info,
-    get_module_version,
-    list_github_tags,
-    USER_MODULES_DIR,
-)
-from .loader import load_module, detect_format
-from .runner import run_module
-from .subagent import run_with_subagents
-from .validator import validate_module
-from .templates import create_module
-from .migrate import migrate_module, migrate_all_modules
-from .providers import check_provider_status
-
-app = typer.Typer(
+
+# Heavy modules (runner, validator, providers, registry, rich tables) are
+# imported inside the commands that use them so `cog --help`, `--version`
+# and simple commands stay near the interpreter's cold-start floor
+
+# Commands are plain functions registered on demand (see _register /
+# main below) so a single invocation only builds the one Click parser it
+# needs. `from cognitive.cli import app` still yields a fully registered
+# application via the module __getattr__ hook.
+_app = typer.Typer(
     name="cog",
     help="Cognitive Modules CLI - Structured LLM task runner",
     add_completion=False,
 )
 console = Console()
 
+# Descriptors repeated across commands are built once at import; Typer
+# only reads them, so sharing an instance between commands is safe
+_MODULE_ARG = typer.Argument(..., help="Module name or path")
+_MODULE_OR_ALL_ARG = typer.Argument(None, help="Module name or path (omit for --all)")
+_GITHUB_URL_ARG = typer.Argument(..., help="GitHub URL or org/repo shorthand")
+_NAME_OPT = typer.Option(None, "--name", "-n", help="Override module name")
+
 
-@app.command("list")
 def list_cmd(
     format: str = typer.Option("table", "--format", "-f", help="Output format: table, json"),
 ):
     """List all installed cognitive modules."""
+    import json
+    from .registry import list_modules
+
     modules = list_modules()
     
     if not modules:
@@ -77,7 +71,15 @@ def list_cmd(
     if format == "json":
         print(json.dumps([{"name": m["name"], "location": m["location"], "format": m["format"]} for m in modules], indent=2))
         return
-    
+
+    if not sys.stdout.isatty():
+        # Piped output: plain tab-separated rows, no Rich import, grep-friendly
+        for m in modules:
+            print(f"{m['name']}\t{m['location']}\t{m['format']}\t{m['path']}")
+        return
+
+    from rich.table import Table
+
     table = Table(title="Installed Modules")
     table.add_column("Name", style="cyan")
     table.add_column("Location", style="green")
@@ -90,9 +92,8 @@ def list_cmd(
     console.print(table)
 
 
-@app.command("run")
 def run_cmd(
-    module: str = typer.Argument(..., help="Module name or path"),
+    module: str = _MODULE_ARG,
     input_file: Optional[Path] = typer.Argument(None, help="Input JSON file (optional if using --args)"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file"),
     args: Optional[str] = typer.Option(None, "--args", "-a", help="Direct text input (replaces $ARGUMENTS in prompt)"),
@@ -102,6 +103,8 @@ def run_cmd(
     model: Optional[str] = typer.Option(None, "--model", "-m", help="LLM model override"),
 ):
     """Run a cognitive module with input data or direct arguments."""
+    from . import _json
+
     # Determine input source
     skip_input_validation = False
     if args:
@@ -112,8 +115,9 @@ def run_cmd(
         if not input_file.exists():
             rprint(f"[red]Error: Input file not found: {input_file}[/red]")
             raise typer.Exit(1)
-        with open(input_file, 'r', encoding='utf-8') as f:
-            input_data = json.load(f)
+        # Read bytes once and parse via orjson when available; large
+        # code-review inputs dominate pre-LLM latency otherwise
+        input_data = _json.loads(input_file.read_bytes())
     else:
         rprint("[red]Error: Provide either input file or --args[/red]")
         raise typer.Exit(1)
@@ -124,6 +128,8 @@ def run_cmd(
     try:
         if subagent:
             # Use subagent orchestrator for @call support
+            from .subagent import run_with_subagents
+
             result = run_with_subagents(
                 module,
                 input_data,
@@ -132,6 +138,8 @@ def run_cmd(
                 validate_output=not no_validate,
             )
         else:
+            from .runner import run_module
+
             result = run_module(
                 module,
                 input_data,
@@ -140,15 +148,20 @@ def run_cmd(
                 model=model,
             )
         
-        indent = 2 if pretty else None
-        output_json = json.dumps(result, indent=indent, ensure_ascii=False)
-        
+        # Serialise once to UTF-8 bytes; no intermediate str for large outputs
+        output_bytes = _json.dumps_bytes(result, indent=pretty)
+
         if output:
-            with open(output, 'w', encoding='utf-8') as f:
-                f.write(output_json)
+            with open(output, 'wb') as f:
+                f.write(output_bytes)
             rprint(f"[green]✓[/green] Output saved to: {output}")
         else:
-            print(output_json)
+            sys.stdout.buffer.write(output_bytes)
+            if sys.stdout.isatty():
+                # Only cosmetic: don't append a stray newline into
+                # redirected JSON (cog run ... > out.json)
+                sys.stdout.buffer.write(b"\n")
+            sys.stdout.flush()
         
         if "confidence" in result:
             conf = result["confidence"]
@@ -160,18 +173,66 @@ def run_cmd(
         raise typer.Exit(1)
 
 
-@app.command("validate")
 def validate_cmd(
-    module: str = typer.Argument(..., help="Module name or path"),
+    module: Optional[str] = _MODULE_OR_ALL_ARG,
     v22: bool = typer.Option(False, "--v22", help="Validate v2.2 format requirements"),
+    all_modules: bool = typer.Option(False, "--all", "-a", help="Validate all installed modules concurrently"),
 ):
     """
     Validate a cognitive module's structure and examples.
-    
+
     Examples:
         cogn validate code-reviewer
         cogn validate code-reviewer --v22   # Check v2.2 requirements
+        cogn validate --all                 # Validate every installed module
     """
+    from .validator import validate_module
+
+    if not module and not all_modules:
+        rprint("[red]Error: Provide module name or use --all[/red]")
+        raise typer.Exit(1)
+
+    if all_modules:
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        from .registry import list_modules
+
+        modules = list_modules()
+        if not modules:
+            rprint("[yellow]No modules found.[/yellow]")
+            return
+
+        rprint(f"[cyan]→[/cyan] Validating {len(modules)} modules...\n")
+
+        paths = [str(m["path"]) for m in modules]
+        if len(paths) > 1:
+            # Validation is compute-bound (YAML/JSON parsing, schema
+            # compilation), so processes beat threads here
+            with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+                results = list(ex.map(partial(validate_module, v22=v22), paths))
+        else:
+            results = [validate_module(paths[0], v22=v22)]
+
+        failed = 0
+        for m, (is_valid, errors, warnings) in zip(modules, results):
+            if is_valid:
+                warn_str = f" [yellow]({len(warnings)} warnings)[/yellow]" if warnings else ""
+                rprint(f"[green]✓[/green] {m['name']}{warn_str}")
+            else:
+                failed += 1
+                rprint(f"[red]✗[/red] {m['name']}")
+                for e in errors:
+                    rprint(f"    - {e}")
+
+        print()
+        if failed:
+            rprint(f"[red]Failed: {failed}/{len(modules)}[/red]")
+            raise typer.Exit(1)
+        rprint(f"[green]Valid: {len(modules)}/{len(modules)}[/green]")
+        return
+
     mode_str = " [dim](v2.2 strict)[/dim]" if v22 else ""
     rprint(f"[cyan]→[/cyan] Validating module: [bold]{module}[/bold]{mode_str}\n")
     
@@ -195,9 +256,8 @@ def validate_cmd(
         raise typer.Exit(1)
 
 
-@app.command("migrate")
 def migrate_cmd(
-    module: Optional[str] = typer.Argument(None, help="Module name or path (omit for --all)"),
+    module: Optional[str] = _MODULE_OR_ALL_ARG,
     all_modules: bool = typer.Option(False, "--all", "-a", help="Migrate all installed modules"),
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Show what would be done without making changes"),
     no_backup: bool = typer.Option(False, "--no-backup", help="Skip creating backup before migration"),
@@ -210,6 +270,8 @@ def migrate_cmd(
         cogn migrate code-reviewer --dry-run # Preview changes
         cogn migrate --all                  # Migrate all modules
     """
+    from .migrate import migrate_module, migrate_all_modules
+
     if not module and not all_modules:
         rprint("[red]Error: Provide module name or use --all[/red]")
         raise typer.Exit(1)
@@ -272,42 +334,62 @@ def migrate_cmd(
             raise typer.Exit(1)
 
 
-@app.command("install")
 def install_cmd(
-    source: str = typer.Argument(..., help="Source: github:org/repo/path, registry:name, or local path"),
-    name: Optional[str] = typer.Option(None, "--name", "-n", help="Override module name"),
+    source: list[str] = typer.Argument(..., help="Source(s): github:org/repo/path, registry:name, or local path"),
+    name: Optional[str] = typer.Option(None, "--name", "-n", help="Override module name (single source only)"),
 ):
-    """Install a cognitive module from git, registry, or local path."""
-    rprint(f"[cyan]→[/cyan] Installing from: {source}")
-    
-    try:
-        target = install_module(source, name)
-        
-        is_valid, errors, warnings = validate_module(str(target))
-        
-        if not is_valid:
-            rprint(f"[red]✗ Installed module failed validation:[/red]")
-            for e in errors:
-                rprint(f"  - {e}")
-            uninstall_module(target.name)
+    """Install one or more cognitive modules from git, registry, or local paths."""
+    from .registry import install_module
+
+    if name and len(source) > 1:
+        rprint("[red]Error: --name only applies to a single source[/red]")
+        raise typer.Exit(1)
+
+    if len(source) == 1:
+        rprint(f"[cyan]→[/cyan] Installing from: {source[0]}")
+
+        try:
+            # Validation runs against the staged source before anything is
+            # copied; a failing module never touches the install dir
+            target = install_module(source[0], name, validate=True)
+
+            rprint(f"[green]✓ Installed: {target.name}[/green]")
+            rprint(f"  Location: {target}")
+
+        except Exception as e:
+            rprint(f"[red]✗ Install failed: {e}[/red]")
             raise typer.Exit(1)
-        
-        rprint(f"[green]✓ Installed: {target.name}[/green]")
-        rprint(f"  Location: {target}")
-        
-        if warnings:
-            rprint(f"[yellow]  Warnings: {len(warnings)}[/yellow]")
-        
-    except Exception as e:
-        rprint(f"[red]✗ Install failed: {e}[/red]")
+        return
+
+    # Batch install: clones are network-bound, so overlap them; the final
+    # swap into the modules dir is serialized inside the registry
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    rprint(f"[cyan]→[/cyan] Installing {len(source)} modules")
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=min(8, len(source))) as executor:
+        futures = {
+            executor.submit(install_module, src, None, validate=True): src
+            for src in source
+        }
+        for future in as_completed(futures):
+            src = futures[future]
+            try:
+                target = future.result()
+                rprint(f"[green]✓ Installed: {target.name}[/green] [dim]({src})[/dim]")
+            except Exception as e:
+                rprint(f"[red]✗ Install failed: {src}: {e}[/red]")
+                failed = True
+
+    if failed:
         raise typer.Exit(1)
 
 
-@app.command("add")
 def add_cmd(
-    url: str = typer.Argument(..., help="GitHub URL or org/repo shorthand"),
+    url: str = _GITHUB_URL_ARG,
     module: str = typer.Option(None, "--module", "-m", help="Module path within repo"),
-    name: Optional[str] = typer.Option(None, "--name", "-n", help="Override module name"),
+    name: Optional[str] = _NAME_OPT,
     branch: str = typer.Option("main", "--branch", "-b", help="Git branch"),
     tag: Optional[str] = typer.Option(None, "--tag", "-t", help="Git tag/version (e.g., v1.0.0)"),
 ):
@@ -324,6 +406,8 @@ def add_cmd(
         
         cog add org/repo -m path/to/module --name my-module
     """
+    from .registry import install_from_github_url, get_module_version
+
     rprint(f"[cyan]→[/cyan] Adding module from: {url}")
     if module:
         rprint(f"  Module path: {module}")
@@ -331,34 +415,23 @@ def add_cmd(
         rprint(f"  Version: {tag}")
     
     try:
+        # Validation happens against the extracted tree before install
         target = install_from_github_url(
             url=url,
             module_path=module,
             name=name,
             branch=branch,
             tag=tag,
+            validate=True,
         )
-        
-        # Validate installed module
-        is_valid, errors, warnings = validate_module(str(target))
-        
-        if not is_valid:
-            rprint(f"[red]✗ Installed module failed validation:[/red]")
-            for e in errors:
-                rprint(f"  - {e}")
-            uninstall_module(target.name)
-            raise typer.Exit(1)
-        
+
         # Get version info
         version = get_module_version(target)
         version_str = f" v{version}" if version else ""
-        
+
         rprint(f"[green]✓ Added: {target.name}{version_str}[/green]")
         rprint(f"  Location: {target}")
-        
-        if warnings:
-            rprint(f"[yellow]  Warnings: {len(warnings)}[/yellow]")
-        
+
         rprint(f"\nRun with:")
         rprint(f"  [cyan]cog run {target.name} --args \"your input\"[/cyan]")
         
@@ -367,7 +440,6 @@ def add_cmd(
         raise typer.Exit(1)
 
 
-@app.command("remove")
 def remove_cmd(
     module: str = typer.Argument(..., help="Module name to remove"),
 ):
@@ -375,7 +447,6 @@ def remove_cmd(
     uninstall_cmd(module)
 
 
-@app.command("update")
 def update_cmd(
     module: str = typer.Argument(..., help="Module name to update"),
     tag: Optional[str] = typer.Option(None, "--tag", "-t", help="Update to specific tag/version"),
@@ -389,6 +460,13 @@ def update_cmd(
         
         cog update code-simplifier --tag v2.0.0
     """
+    from .registry import (
+        get_installed_module_info,
+        get_module_version,
+        install_from_github_url,
+        USER_MODULES_DIR,
+    )
+
     rprint(f"[cyan]→[/cyan] Updating module: {module}")
     
     # Check if module is installed
@@ -444,9 +522,8 @@ def update_cmd(
         raise typer.Exit(1)
 
 
-@app.command("versions")
 def versions_cmd(
-    url: str = typer.Argument(..., help="GitHub URL or org/repo shorthand"),
+    url: str = _GITHUB_URL_ARG,
     limit: int = typer.Option(10, "--limit", "-l", help="Max versions to show"),
 ):
     """
@@ -458,6 +535,10 @@ def versions_cmd(
         
         cog versions https://github.com/org/repo
     """
+    from rich.table import Table
+
+    from .registry import list_github_tags
+
     rprint(f"[cyan]→[/cyan] Fetching versions from: {url}\n")
     
     try:
@@ -482,11 +563,12 @@ def versions_cmd(
         raise typer.Exit(1)
 
 
-@app.command("uninstall")
 def uninstall_cmd(
     module: str = typer.Argument(..., help="Module name to uninstall"),
 ):
     """Uninstall a cognitive module."""
+    from .registry import uninstall_module, USER_MODULES_DIR
+
     target = USER_MODULES_DIR / module
     
     if not target.exists():
@@ -501,7 +583,6 @@ def uninstall_cmd(
         raise typer.Exit(1)
 
 
-@app.command("init")
 def init_cmd(
     name: str = typer.Argument(..., help="Module name (lowercase, hyphenated)"),
     responsibility: str = typer.Option("（描述模块职责）", "--desc", "-d", help="One-line description"),
@@ -518,8 +599,10 @@ def init_cmd(
     name = name.lower()
     
     rprint(f"[cyan]→[/cyan] Creating module: [bold]{name}[/bold]")
-    
+
     try:
+        from .templates import create_module
+
         module_path = create_module(
             name=name,
             target_dir=target,
@@ -544,13 +627,16 @@ def init_cmd(
         raise typer.Exit(1)
 
 
-@app.command("search")
 def search_cmd(
     query: str = typer.Argument(..., help="Search query"),
 ):
     """Search the public module registry."""
+    from rich.table import Table
+
+    from .registry import search_registry
+
     rprint(f"[cyan]→[/cyan] Searching registry for: {query}\n")
-    
+
     results = search_registry(query)
     
     if not results:
@@ -569,13 +655,16 @@ def search_cmd(
     rprint(f"\nInstall with: [cyan]cog install registry:<name>[/cyan]")
 
 
-@app.command("registry")
 def registry_cmd(
     refresh: bool = typer.Option(False, "--refresh", "-r", help="Force refresh from remote"),
 ):
     """Show public registry status and modules."""
+    from rich.table import Table
+
+    from .registry import fetch_registry
+
     rprint("[cyan]→[/cyan] Fetching registry...\n")
-    
+
     registry = fetch_registry(use_cache=not refresh)
     
     if "error" in registry:
@@ -598,13 +687,30 @@ def registry_cmd(
     console.print(table)
 
 
-@app.command("doctor")
 def doctor_cmd():
     """Check environment setup and provider availability."""
-    rprint("[cyan]Cognitive Modules - Environment Check[/cyan]\n")
-    
+    from .providers import check_provider_status
+    from .registry import list_modules
+
     status = check_provider_status()
-    
+
+    if not sys.stdout.isatty():
+        # Piped output: plain text instead of Rich tables
+        print("LLM Providers:")
+        for provider in ["openai", "anthropic", "minimax", "ollama"]:
+            info = status[provider]
+            installed = "yes" if info["installed"] else "no"
+            configured = "yes" if info["configured"] else "no"
+            print(f"{provider}\tinstalled={installed}\tconfigured={configured}")
+        print(f"Current provider: {status['current_provider']}")
+        print(f"Current model: {status['current_model']}")
+        print(f"Installed Modules: {len(list_modules())}")
+        return
+
+    from rich.table import Table
+
+    rprint("[cyan]Cognitive Modules - Environment Check[/cyan]\n")
+
     table = Table(title="LLM Providers")
     table.add_column("Provider", style="cyan")
     table.add_column("Installed")
@@ -635,11 +741,13 @@ def doctor_cmd():
         rprint("  [dim]export OPENAI_API_KEY=sk-...[/dim]")
 
 
-@app.command("info")
 def info_cmd(
-    module: str = typer.Argument(..., help="Module name or path"),
+    module: str = _MODULE_ARG,
 ):
     """Show detailed information about a module."""
+    from .loader import load_module
+    from .registry import find_module, get_installed_module_info
+
     # Find module
     path = Path(module)
     if path.exists() and path.is_dir():
@@ -698,7 +806,6 @@ def info_cmd(
         rprint(f"\n  Update with: [cyan]cog update {meta.get('name', module)}[/cyan]")
 
 
-@app.command("serve")
 def serve_cmd(
     host: str = typer.Option("0.0.0.0", "--host", "-h", help="Host to bind"),
     port: int = typer.Option(8000, "--port", "-p", help="Port to bind"),
@@ -731,7 +838,6 @@ def serve_cmd(
     uvicorn.run("cognitive.server:app", host=host, port=port, reload=False)
 
 
-@app.command("mcp")
 def mcp_cmd():
     """
     Start MCP (Model Context Protocol) server.
@@ -762,8 +868,8 @@ def mcp_cmd():
     serve()
 
 
-@app.callback(invoke_without_command=True)
-def main(
+@_app.callback(invoke_without_command=True)
+def _callback(
     ctx: typer.Context,
     version: bool = typer.Option(False, "--version", "-v", help="Show version"),
 ):
@@ -771,10 +877,69 @@ def main(
     if version:
         rprint(f"cog version {__version__}")
         raise typer.Exit()
-    
+
     if ctx.invoked_subcommand is None:
         rprint(ctx.get_help())
 
 
+_COMMANDS = {
+    "list": list_cmd,
+    "run": run_cmd,
+    "validate": validate_cmd,
+    "migrate": migrate_cmd,
+    "install": install_cmd,
+    "add": add_cmd,
+    "remove": remove_cmd,
+    "update": update_cmd,
+    "versions": versions_cmd,
+    "uninstall": uninstall_cmd,
+    "init": init_cmd,
+    "search": search_cmd,
+    "registry": registry_cmd,
+    "doctor": doctor_cmd,
+    "info": info_cmd,
+    "serve": serve_cmd,
+    "mcp": mcp_cmd,
+}
+
+_registered: set = set()
+
+
+def _register(name: str) -> None:
+    """Register a single command's parser on the app."""
+    if name not in _registered:
+        _registered.add(name)
+        _app.command(name)(_COMMANDS[name])
+
+
+def _register_all() -> None:
+    for name in _COMMANDS:
+        _register(name)
+
+
+def __getattr__(name: str):
+    # Importing `app` (tests, embedding) gets the fully registered CLI
+    if name == "app":
+        _register_all()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main() -> None:
+    """Console entry point with lazy subcommand registration."""
+    argv = sys.argv[1:]
+    if argv and argv[0] in ("--version", "-v"):
+        # Short-circuit before Typer builds any parser
+        rprint(f"cog version {__version__}")
+        raise SystemExit(0)
+
+    if argv and argv[0] in _COMMANDS:
+        _register(argv[0])
+    else:
+        # --help, bare invocation or unknown command: show everything
+        _register_all()
+    _app()
+
+
 if __name__ == "__main__":
-    app()
+    main()
@@ -25,12 +25,37 @@ Format v0 (old, deprecated):
   - prompt.txt
 """
 
+import copy
 import json
+import os
 from pathlib import Path
 from typing import Optional, Literal
 
+import jsonschema
 import yaml
 
+from . import _json
+
+try:
+    import jsonschema_rs  # Optional Rust-backed validator (pip install jsonschema-rs)
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import fastjsonschema  # Optional codegen validator (pip install fastjsonschema)
+except ImportError:
+    fastjsonschema = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml, much faster parse
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from yaml import CSafeDumper as _YamlDumper  # libyaml serializer
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 # =============================================================================
 # Type Definitions (v2.2)
@@ -41,6 +66,108 @@ SchemaStrictness = Literal["high", "medium", "low"]
 EnumStrategy = Literal["strict", "extensible"]
 
 
+# =============================================================================
+# Schema Compilation
+# =============================================================================
+
+class _RsValidationError:
+    """Mirror the jsonschema error attributes used by runner.validate_data."""
+
+    __slots__ = ("message", "absolute_path")
+
+    def __init__(self, error):
+        self.message = error.message
+        self.absolute_path = list(getattr(error, "instance_path", []))
+
+
+class _RsValidator:
+    """Wrap a compiled jsonschema_rs schema behind the jsonschema validator API."""
+
+    __slots__ = ("_compiled",)
+
+    def __init__(self, compiled):
+        self._compiled = compiled
+
+    def is_valid(self, data) -> bool:
+        return self._compiled.is_valid(data)
+
+    def iter_errors(self, data):
+        for error in self._compiled.iter_errors(data):
+            yield _RsValidationError(error)
+
+
+class _FastValidationError:
+    """Mirror the jsonschema error attributes used by runner.validate_data."""
+
+    __slots__ = ("message", "absolute_path")
+
+    def __init__(self, exc):
+        self.message = exc.message
+        # fastjsonschema paths start with the instance variable name
+        self.absolute_path = list(exc.path)[1:]
+
+
+class _FastValidator:
+    """Wrap a fastjsonschema-compiled function behind the jsonschema validator API."""
+
+    __slots__ = ("_compiled",)
+
+    def __init__(self, compiled):
+        self._compiled = compiled
+
+    def is_valid(self, data) -> bool:
+        try:
+            self._compiled(data)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            return False
+
+    def iter_errors(self, data):
+        # fastjsonschema stops at the first failure, so at most one error
+        try:
+            self._compiled(data)
+        except fastjsonschema.JsonSchemaException as exc:
+            yield _FastValidationError(exc)
+
+
+def _dump_constraints(constraints: dict) -> str:
+    """Serialize constraints once at load time for build_prompt."""
+    return yaml.dump(constraints, Dumper=_YamlDumper, default_flow_style=False)
+
+
+def build_schema_validator(schema: dict):
+    """
+    Compile a JSON Schema into a reusable validator.
+
+    Building the validator once per module load avoids re-resolving the
+    meta-schema and re-walking the schema on every validation call. When
+    the Rust-backed jsonschema_rs binding is installed it is preferred
+    (native single-pass validation), then fastjsonschema (generates
+    specialised Python code per schema); otherwise the pure-Python
+    jsonschema validator is used. Returns None for empty or invalid
+    schemas (callers fall back to the uncompiled path, which surfaces
+    SchemaError as before).
+    """
+    if not schema:
+        return None
+    if jsonschema_rs is not None:
+        try:
+            return _RsValidator(jsonschema_rs.JSONSchema(schema))
+        except Exception:
+            pass  # Invalid or unsupported schema - try the Python validator
+    if fastjsonschema is not None:
+        try:
+            return _FastValidator(fastjsonschema.compile(schema))
+        except Exception:
+            pass
+    validator_cls = jsonschema.validators.validator_for(schema)
+    try:
+        validator_cls.check_schema(schema)
+    except jsonschema.SchemaError:
+        return None
+    return validator_cls(schema)
+
+
 # =============================================================================
 # Format Detection
 # =============================================================================
@@ -82,7 +209,7 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     if len(parts) < 3:
         return {}, content
     
-    frontmatter = yaml.safe_load(parts[1]) or {}
+    frontmatter = yaml.load(parts[1], Loader=_YamlLoader) or {}
     body = parts[2].strip()
     return frontmatter, body
 
@@ -95,7 +222,7 @@ def load_v2_format(module_path: Path) -> dict:
     """Load module in v2.x format (module.yaml + prompt.md + schema.json)."""
     # Load module.yaml
     with open(module_path / "module.yaml", 'r', encoding='utf-8') as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=_YamlLoader)
     
     # Detect version
     version_str = detect_v2_version(manifest)
@@ -111,8 +238,7 @@ def load_v2_format(module_path: Path) -> dict:
     # Load schema.json
     schema_path = module_path / "schema.json"
     if schema_path.exists():
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
+        schema = _json.loads(schema_path.read_bytes())
         
         input_schema = schema.get("input", {})
         
@@ -201,7 +327,12 @@ def load_v2_format(module_path: Path) -> dict:
     
     io_config = manifest.get("io", {})
     tests = manifest.get("tests", [])
-    
+
+    # Precompile validators so run_module doesn't rebuild them per call
+    input_validator = build_schema_validator(input_schema)
+    data_validator = build_schema_validator(data_schema)
+    meta_validator = build_schema_validator(meta_schema)
+
     return {
         # Core identity
         "name": manifest.get("name", module_path.name),
@@ -224,9 +355,16 @@ def load_v2_format(module_path: Path) -> dict:
         "error_schema": error_schema,
         "meta_schema": meta_schema,       # v2.2
         "schema_defs": defs,
+
+        # Precompiled validators (None when the schema is empty/invalid)
+        "input_validator": input_validator,
+        "output_validator": data_validator,  # v2.1 compat alias
+        "data_validator": data_validator,
+        "meta_validator": meta_validator,
         
         # Constraints and policies
         "constraints": constraints,
+        "constraints_yaml": _dump_constraints(constraints),
         "policies": policies,
         "tools": tools,
         
@@ -279,14 +417,15 @@ def load_v1_format(module_path: Path) -> dict:
     # Load schema.json
     schema_path = module_path / "schema.json"
     if schema_path.exists():
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
+        schema = _json.loads(schema_path.read_bytes())
         input_schema = schema.get("input", {})
         output_schema = schema.get("output", {})
     else:
         input_schema = {}
         output_schema = {}
-    
+
+    output_validator = build_schema_validator(output_schema)
+
     return {
         "name": metadata.get("name", module_path.name),
         "version": metadata.get("version", "1.0.0"),
@@ -299,7 +438,11 @@ def load_v1_format(module_path: Path) -> dict:
         "input_schema": input_schema,
         "output_schema": output_schema,
         "data_schema": output_schema,  # Alias for v2.2 compat
+        "input_validator": build_schema_validator(input_schema),
+        "output_validator": output_validator,
+        "data_validator": output_validator,
         "constraints": constraints,
+        "constraints_yaml": _dump_constraints(constraints),
         "prompt": prompt,
         # v2.2 defaults for v1 modules
         "tier": None,
@@ -314,29 +457,50 @@ def load_v1_format(module_path: Path) -> dict:
 # v0 Loader (Deprecated)
 # =============================================================================
 
+def _read_frontmatter(path: Path) -> dict:
+    """Parse just the YAML frontmatter without reading the whole file.
+
+    Reads 4 KiB chunks until the closing '---' appears, so a long body
+    after the frontmatter is never loaded. Returns {} for files without
+    (or with unterminated) frontmatter, matching parse_frontmatter.
+    """
+    with open(path, 'rb') as f:
+        buf = f.read(4096)
+        if not buf.startswith(b'---'):
+            return {}
+        while True:
+            end = buf.find(b'\n---', 3)
+            if end != -1:
+                raw = buf[3:end]
+                break
+            chunk = f.read(4096)
+            if not chunk:
+                return {}
+            buf += chunk
+    return yaml.load(raw.decode('utf-8'), Loader=_YamlLoader) or {}
+
+
 def load_v0_format(module_path: Path) -> dict:
     """Load module in v0 format (old 6-file format)."""
-    # Load module.md
-    with open(module_path / "module.md", 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    metadata, _ = parse_frontmatter(content)
-    
+    # v0 keeps the prompt in prompt.txt, so only the frontmatter of
+    # module.md is needed; skip reading its body
+    metadata = _read_frontmatter(module_path / "module.md")
+
     # Load schemas
-    with open(module_path / "input.schema.json", 'r', encoding='utf-8') as f:
-        input_schema = json.load(f)
+    input_schema = _json.loads((module_path / "input.schema.json").read_bytes())
+    output_schema = _json.loads((module_path / "output.schema.json").read_bytes())
     
-    with open(module_path / "output.schema.json", 'r', encoding='utf-8') as f:
-        output_schema = json.load(f)
-    
-    # Load constraints
-    with open(module_path / "constraints.yaml", 'r', encoding='utf-8') as f:
-        constraints = yaml.safe_load(f)
+    # Load constraints, keeping the raw text so build_prompt can splice
+    # it directly instead of re-dumping the parsed dict
+    constraints_raw = (module_path / "constraints.yaml").read_text(encoding='utf-8')
+    constraints = yaml.load(constraints_raw, Loader=_YamlLoader)
     
     # Load prompt
     with open(module_path / "prompt.txt", 'r', encoding='utf-8') as f:
         prompt = f.read()
-    
+
+    output_validator = build_schema_validator(output_schema)
+
     return {
         "name": metadata.get("name", module_path.name),
         "version": metadata.get("version", "1.0.0"),
@@ -349,7 +513,11 @@ def load_v0_format(module_path: Path) -> dict:
         "input_schema": input_schema,
         "output_schema": output_schema,
         "data_schema": output_schema,  # Alias
+        "input_validator": build_schema_validator(input_schema),
+        "output_validator": output_validator,
+        "data_validator": output_validator,
         "constraints": constraints,
+        "constraints_yaml": constraints_raw,
         "prompt": prompt,
         # v2.2 defaults
         "tier": None,
@@ -364,15 +532,66 @@ def load_v0_format(module_path: Path) -> dict:
 # Main Loader
 # =============================================================================
 
+# Parsed modules keyed by resolved path; the signature captures the mtime/size
+# of the module directory and its top-level files so edits invalidate entries.
+_MODULE_CACHE: dict[Path, tuple[tuple, dict]] = {}
+
+
+def _module_signature(module_path: Path) -> tuple:
+    """Compute a freshness signature for a module directory.
+
+    Only top-level entries are stat'ed: every file the loaders read
+    (module.yaml / MODULE.md / module.md, schema.json, the split schema
+    files, constraints.yaml, prompt.txt) lives at the directory root, so
+    one scandir covers them all. Subdirectories such as examples/ are
+    not parsed by load_module and are deliberately excluded.
+    """
+    entries = [("", module_path.stat().st_mtime_ns, 0)]
+    with os.scandir(module_path) as it:
+        for entry in it:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    entries.sort()
+    return tuple(entries)
+
+
 def load_module(module_path: Path) -> dict:
-    """Load a module, auto-detecting format."""
+    """
+    Load a module, auto-detecting format.
+
+    Results are cached per resolved path and reused while the module
+    directory is unchanged, so repeated runs skip the file reads and
+    YAML/JSON parsing. Returned dicts are shallow copies; treat nested
+    values as read-only. Use load_module.cache_clear() in tests.
+    """
+    module_path = Path(module_path).resolve()
+    try:
+        sig = _module_signature(module_path)
+    except OSError:
+        sig = None
+
+    if sig is not None:
+        cached = _MODULE_CACHE.get(module_path)
+        if cached is not None and cached[0] == sig:
+            return copy.copy(cached[1])
+
     fmt = detect_format(module_path)
     if fmt == "v2":
-        return load_v2_format(module_path)
+        module = load_v2_format(module_path)
     elif fmt == "v1":
-        return load_v1_format(module_path)
+        module = load_v1_format(module_path)
     else:
-        return load_v0_format(module_path)
+        module = load_v0_format(module_path)
+
+    if sig is not None:
+        _MODULE_CACHE[module_path] = (sig, module)
+    return copy.copy(module)
+
+
+load_module.cache_clear = _MODULE_CACHE.clear
 
 
 # =============================================================================
@@ -10,6 +10,8 @@ Cognitive Modules MCP Server
     python -m cognitive.mcp_server
 """
 
+import contextlib
+import functools
 from typing import Optional, Any
 import json
 import os
@@ -23,7 +25,7 @@ except ImportError:
     )
 
 from .registry import list_modules, find_module
-from .loader import load_module
+from .loader import load_module, _module_signature
 from .runner import run_module as execute_module
 
 # ============================================================
@@ -36,6 +38,51 @@ mcp = FastMCP(
 )
 
 
+@contextlib.contextmanager
+def _env_override(**overrides):
+    """临时覆盖环境变量；值为 None/空的键不做任何修改。"""
+    overrides = {k: v for k, v in overrides.items() if v}
+    old = {k: os.environ.get(k) for k in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for k, v in old.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+@functools.lru_cache(maxsize=1)
+def _list_modules_cached() -> list:
+    """缓存模块列表：服务器进程常驻，避免每次工具调用都重新扫描目录。"""
+    return list_modules()
+
+
+@functools.lru_cache(maxsize=1)
+def _list_response() -> dict:
+    """缓存 cognitive_list 的完整响应结构，重复调用零分配。"""
+    modules = _list_modules_cached()
+    return {
+        "modules": [
+            {"name": m["name"], "location": m["location"], "format": m["format"]}
+            for m in modules
+        ],
+        "count": len(modules),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _modules_resource_json() -> str:
+    """缓存 cognitive://modules 资源的序列化结果。"""
+    return json.dumps([m["name"] for m in _list_modules_cached()], indent=2)
+
+
+# cognitive_info 结果缓存：模块名 -> (文件签名, 结果)，文件改动后自动失效
+_INFO_CACHE: dict[str, tuple[tuple, dict]] = {}
+
+
 # ============================================================
 # Tools
 # ============================================================
@@ -72,38 +119,25 @@ def cognitive_run(
             }
         }
     """
-    # 检查模块是否存在
+    # 检查模块是否存在（只查找一次，之后按路径执行）
     module_path = find_module(module)
     if not module_path:
         return {"ok": False, "error": f"Module '{module}' not found"}
-    
-    # 设置 provider（如果指定）
-    original_provider = os.environ.get("LLM_PROVIDER")
-    original_model = os.environ.get("LLM_MODEL")
-    
+
     try:
-        if provider:
-            os.environ["LLM_PROVIDER"] = provider
-        if model:
-            os.environ["LLM_MODEL"] = model
-        
-        # 执行模块
-        result = execute_module(module, args=args)
-        
+        # 指定 provider 时临时覆盖环境变量；model 直接走 kwargs
+        with _env_override(LLM_PROVIDER=provider):
+            # 执行模块：直接传路径，跳过 run_module 内部的重复查找
+            result = execute_module(
+                str(module_path),
+                {"$ARGUMENTS": args, "query": args},
+                validate_input=False,
+                model=model,
+            )
+
         return {"ok": True, "data": result, "module": module}
     except Exception as e:
         return {"ok": False, "error": str(e), "module": module}
-    finally:
-        # 恢复原始环境变量
-        if original_provider:
-            os.environ["LLM_PROVIDER"] = original_provider
-        elif "LLM_PROVIDER" in os.environ and provider:
-            del os.environ["LLM_PROVIDER"]
-        
-        if original_model:
-            os.environ["LLM_MODEL"] = original_model
-        elif "LLM_MODEL" in os.environ and model:
-            del os.environ["LLM_MODEL"]
 
 
 @mcp.tool()
@@ -126,14 +160,7 @@ def cognitive_list() -> dict[str, Any]:
             "count": 2
         }
     """
-    modules = list_modules()
-    return {
-        "modules": [
-            {"name": m["name"], "location": m["location"], "format": m["format"]}
-            for m in modules
-        ],
-        "count": len(modules),
-    }
+    return _list_response()
 
 
 @mcp.tool()
@@ -161,12 +188,19 @@ def cognitive_info(module: str) -> dict[str, Any]:
     module_path = find_module(module)
     if not module_path:
         return {"ok": False, "error": f"Module '{module}' not found"}
-    
+
     try:
-        m = load_module(module)
-        meta = m.get("meta", {})
-        
-        return {
+        # 按文件签名缓存：模块未改动时直接复用上次的结果
+        sig = _module_signature(module_path)
+        cached = _INFO_CACHE.get(module)
+        if cached is not None and cached[0] == sig:
+            return cached[1]
+
+        # 按路径加载，命中 loader 的模块缓存
+        m = load_module(module_path)
+        meta = m.get("metadata", {})
+
+        info = {
             "ok": True,
             "name": meta.get("name", module),
             "version": meta.get("version"),
@@ -175,10 +209,30 @@ def cognitive_info(module: str) -> dict[str, Any]:
             "input_schema": m.get("input_schema"),
             "output_schema": m.get("output_schema"),
         }
+        _INFO_CACHE[module] = (sig, info)
+        return info
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
 
+@mcp.tool()
+def cognitive_refresh() -> dict[str, Any]:
+    """
+    刷新服务器内部缓存。
+
+    安装或删除模块后调用，无需重启 MCP 服务器即可看到最新模块列表。
+
+    Returns:
+        {"ok": true}
+    """
+    _list_modules_cached.cache_clear()
+    _list_response.cache_clear()
+    _modules_resource_json.cache_clear()
+    _INFO_CACHE.clear()
+    load_module.cache_clear()
+    return {"ok": True}
+
+
 # ============================================================
 # Resources
 # ============================================================
@@ -186,8 +240,7 @@ def cognitive_info(module: str) -> dict[str, Any]:
 @mcp.resource("cognitive://modules")
 def get_modules_resource() -> str:
     """获取所有模块列表（资源形式）"""
-    modules = list_modules()
-    return json.dumps([m["name"] for m in modules], indent=2)
+    return _modules_resource_json()
 
 
 @mcp.resource("cognitive://module/{name}")
@@ -198,7 +251,7 @@ def get_module_resource(name: str) -> str:
         return f"Module '{name}' not found"
     
     try:
-        m = load_module(name)
+        m = load_module(module_path)
         return m.get("prompt", "")
     except Exception as e:
         return f"Error: {e}"
@@ -208,28 +261,24 @@ def get_module_resource(name: str) -> str:
 # Prompts
 # ============================================================
 
+# 固定的提示词片段抽成常量：大段代码入参时避免 f-string 重复拷贝整个 payload
+_CR_PREFIX = "请使用 cognitive_run 工具审查以下代码：\n\n```\n"
+_CR_SUFFIX = '\n```\n\n调用: cognitive_run("code-reviewer", "'
+_TP_PREFIX = "请使用 cognitive_run 工具对以下任务进行优先级排序：\n\n"
+_TP_SUFFIX = '\n\n调用: cognitive_run("task-prioritizer", "'
+
+
 @mcp.prompt()
 def code_review_prompt(code: str) -> str:
     """生成代码审查提示"""
-    return f"""请使用 cognitive_run 工具审查以下代码：
-
-```
-{code}
-```
-
-调用: cognitive_run("code-reviewer", "{code[:100]}...")
-"""
+    hint = code[:100] + ("..." if len(code) > 100 else "")
+    return "".join([_CR_PREFIX, code, _CR_SUFFIX, hint, '")\n'])
 
 
 @mcp.prompt()
 def task_prioritize_prompt(tasks: str) -> str:
     """生成任务排序提示"""
-    return f"""请使用 cognitive_run 工具对以下任务进行优先级排序：
-
-{tasks}
-
-调用: cognitive_run("task-prioritizer", "{tasks}")
-"""
+    return "".join([_TP_PREFIX, tasks, _TP_SUFFIX, tasks, '")\n'])
 
 
 # ============================================================
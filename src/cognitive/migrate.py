@@ -17,7 +17,7 @@ from datetime import datetime
 import yaml
 
 from .registry import find_module, list_modules
-from .loader import detect_format, parse_frontmatter
+from .loader import detect_format, parse_frontmatter, _YamlLoader, _YamlDumper
 
 
 # =============================================================================
@@ -63,7 +63,7 @@ def migrate_module(
         module_yaml_path = module_path / "module.yaml"
         if module_yaml_path.exists():
             with open(module_yaml_path, 'r', encoding='utf-8') as f:
-                manifest = yaml.safe_load(f)
+                manifest = yaml.load(f, Loader=_YamlLoader)
             if manifest.get('tier') is not None:
                 warnings.append("Module appears to already be v2.2 format")
                 return True, [], warnings
@@ -235,7 +235,7 @@ def _migrate_from_v2(
     # Load module.yaml
     module_yaml_path = module_path / "module.yaml"
     with open(module_yaml_path, 'r', encoding='utf-8') as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=_YamlLoader)
     
     # Load schema.json
     schema_path = module_path / "schema.json"
@@ -614,7 +614,7 @@ def _write_yaml(path: Path, data: dict) -> None:
     with open(path, 'w', encoding='utf-8') as f:
         # Add header comment
         f.write("# Cognitive Module Manifest v2.2\n")
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
 
 def _write_json(path: Path, data: dict) -> None:
@@ -8,9 +8,24 @@ Supports both synchronous and streaming modes:
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Iterator
 
+from . import llm_cache
+from . import semantic_cache
+
+try:
+    import ahocorasick  # Optional multi-pattern matcher (pip install pyahocorasick)
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Baked at build time by scripts/build-stub-index.py
+    from ._stub_index import STUB_INDEX as _BAKED_STUB_INDEX
+except ImportError:
+    _BAKED_STUB_INDEX = None
+
 
 def call_llm(prompt: str, model: Optional[str] = None) -> str:
     """
@@ -29,17 +44,140 @@ def call_llm(prompt: str, model: Optional[str] = None) -> str:
         The LLM's response as a string
     """
     provider = os.environ.get("LLM_PROVIDER", "stub").lower()
-    
+
+    cached, cache_key, use_semantic = _cache_lookup(provider, prompt, model)
+    if cached is not None:
+        return cached
+
+    if provider == "openai":
+        response = _call_openai(prompt, model)
+    elif provider == "anthropic":
+        response = _call_anthropic(prompt, model)
+    elif provider == "ollama":
+        response = _call_ollama(prompt, model)
+    elif provider == "minimax":
+        response = _call_minimax(prompt, model)
+    else:
+        response = _call_stub(prompt)
+
+    _cache_store(cache_key, use_semantic, prompt, response)
+    return response
+
+
+def _cache_lookup(provider: str, prompt: str, model: Optional[str]):
+    """
+    Consult the exact-match and semantic caches.
+
+    Returns (cached_response_or_None, exact_cache_key_or_None, use_semantic).
+    The stub provider is already local, so it is never cached.
+    """
+    cache_key = None
+    if provider != "stub" and llm_cache.cache_enabled():
+        cache_key = llm_cache.cache_key(
+            provider, model or os.environ.get("LLM_MODEL"), prompt
+        )
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            return cached, cache_key, False
+
+    use_semantic = provider != "stub" and semantic_cache.cache_enabled()
+    if use_semantic:
+        cached = semantic_cache.lookup(prompt)
+        if cached is not None:
+            return cached, cache_key, use_semantic
+
+    return None, cache_key, use_semantic
+
+
+def _cache_store(cache_key: Optional[str], use_semantic: bool, prompt: str, response: str) -> None:
+    """Record a provider response in the enabled caches."""
+    if cache_key is not None:
+        llm_cache.set(cache_key, response)
+    if use_semantic:
+        semantic_cache.store(prompt, response)
+
+
+async def acall_llm(prompt: str, model: Optional[str] = None) -> str:
+    """
+    Async variant of call_llm for concurrent batch execution.
+
+    Uses the provider SDKs' async clients (AsyncOpenAI / AsyncAnthropic)
+    when available; other providers run in a worker thread so callers can
+    still overlap many calls with asyncio.gather. Shares the response
+    caches with call_llm.
+    """
+    import asyncio
+
+    provider = os.environ.get("LLM_PROVIDER", "stub").lower()
+
+    cached, cache_key, use_semantic = _cache_lookup(provider, prompt, model)
+    if cached is not None:
+        return cached
+
     if provider == "openai":
-        return _call_openai(prompt, model)
+        response = await _acall_openai(prompt, model)
     elif provider == "anthropic":
-        return _call_anthropic(prompt, model)
+        response = await _acall_anthropic(prompt, model)
     elif provider == "ollama":
-        return _call_ollama(prompt, model)
+        response = await asyncio.to_thread(_call_ollama, prompt, model)
     elif provider == "minimax":
-        return _call_minimax(prompt, model)
+        response = await asyncio.to_thread(_call_minimax, prompt, model)
     else:
-        return _call_stub(prompt)
+        response = await asyncio.to_thread(_call_stub, prompt)
+
+    _cache_store(cache_key, use_semantic, prompt, response)
+    return response
+
+
+async def _acall_openai(prompt: str, model: Optional[str] = None) -> str:
+    """Call OpenAI API asynchronously."""
+    try:
+        from openai import AsyncOpenAI
+    except ImportError:
+        raise ImportError("OpenAI not installed. Run: pip install cognitive[openai]")
+
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable not set")
+
+    client = _get_async_openai_client(api_key)
+    model = model or os.environ.get("LLM_MODEL", "gpt-4o")
+
+    response = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": "You output only valid JSON matching the required schema."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.2,
+        response_format={"type": "json_object"}
+    )
+
+    return response.choices[0].message.content
+
+
+async def _acall_anthropic(prompt: str, model: Optional[str] = None) -> str:
+    """Call Anthropic Claude API asynchronously."""
+    try:
+        import anthropic
+    except ImportError:
+        raise ImportError("Anthropic not installed. Run: pip install cognitive[anthropic]")
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+
+    client = _get_async_anthropic_client(api_key)
+    model = model or os.environ.get("LLM_MODEL", "claude-sonnet-4-20250514")
+
+    response = await client.messages.create(
+        model=model,
+        max_tokens=8192,
+        system="You output only valid JSON matching the required schema.",
+        messages=[{"role": "user", "content": prompt}]
+    )
+
+    return response.content[0].text
 
 
 def call_llm_stream(prompt: str, model: Optional[str] = None) -> Iterator[str]:
@@ -81,9 +219,9 @@ def _stream_openai(prompt: str, model: Optional[str] = None) -> Iterator[str]:
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable not set")
     
-    client = OpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
     model = model or os.environ.get("LLM_MODEL", "gpt-4o")
-    
+
     stream = client.chat.completions.create(
         model=model,
         messages=[
@@ -110,9 +248,9 @@ def _stream_anthropic(prompt: str, model: Optional[str] = None) -> Iterator[str]
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
     
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_anthropic_client(api_key)
     model = model or os.environ.get("LLM_MODEL", "claude-sonnet-4-20250514")
-    
+
     with client.messages.stream(
         model=model,
         max_tokens=8192,
@@ -134,12 +272,9 @@ def _stream_minimax(prompt: str, model: Optional[str] = None) -> Iterator[str]:
     if not api_key:
         raise ValueError("MINIMAX_API_KEY environment variable not set")
     
-    client = OpenAI(
-        api_key=api_key,
-        base_url="https://api.minimax.chat/v1"
-    )
+    client = _get_openai_client(api_key, base_url="https://api.minimax.chat/v1")
     model = model or os.environ.get("LLM_MODEL", "MiniMax-Text-01")
-    
+
     stream = client.chat.completions.create(
         model=model,
         messages=[
@@ -155,17 +290,41 @@ def _stream_minimax(prompt: str, model: Optional[str] = None) -> Iterator[str]:
             yield chunk.choices[0].delta.content
 
 
+# Shared session so repeated Ollama calls reuse pooled TCP connections
+# instead of paying a fresh handshake per request.
+_ollama_session = None
+
+
+def _get_ollama_session():
+    """Return the module-wide requests.Session for Ollama calls."""
+    global _ollama_session
+    if _ollama_session is None:
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter, Retry
+        except ImportError:
+            raise ImportError("Requests not installed. Run: pip install cognitive[ollama]")
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _ollama_session = session
+    return _ollama_session
+
+
 def _stream_ollama(prompt: str, model: Optional[str] = None) -> Iterator[str]:
     """Stream from local Ollama instance."""
-    try:
-        import requests
-    except ImportError:
-        raise ImportError("Requests not installed. Run: pip install cognitive[ollama]")
-    
+    session = _get_ollama_session()
+
     host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
     model = model or os.environ.get("LLM_MODEL", "llama3.1")
-    
-    response = requests.post(
+
+    response = session.post(
         f"{host}/api/generate",
         json={
             "model": model,
@@ -174,7 +333,8 @@ def _stream_ollama(prompt: str, model: Optional[str] = None) -> Iterator[str]:
             "format": "json",
             "options": {"temperature": 0.2}
         },
-        stream=True
+        stream=True,
+        timeout=(5, 120)
     )
     response.raise_for_status()
     
@@ -189,18 +349,44 @@ def _stream_ollama(prompt: str, model: Optional[str] = None) -> Iterator[str]:
                 continue
 
 
+# Clients keep httpx connection pools alive; constructing one per call
+# pays TCP+TLS setup each time, so they are cached per API key
+@lru_cache(maxsize=4)
+def _get_openai_client(api_key: str, base_url: Optional[str] = None):
+    from openai import OpenAI
+    return OpenAI(api_key=api_key, base_url=base_url)
+
+
+@lru_cache(maxsize=4)
+def _get_anthropic_client(api_key: str):
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _get_async_openai_client(api_key: str):
+    from openai import AsyncOpenAI
+    return AsyncOpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _get_async_anthropic_client(api_key: str):
+    import anthropic
+    return anthropic.AsyncAnthropic(api_key=api_key)
+
+
 def _call_openai(prompt: str, model: Optional[str] = None) -> str:
     """Call OpenAI API."""
     try:
         from openai import OpenAI
     except ImportError:
         raise ImportError("OpenAI not installed. Run: pip install cognitive[openai]")
-    
+
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable not set")
-    
-    client = OpenAI(api_key=api_key)
+
+    client = _get_openai_client(api_key)
     model = model or os.environ.get("LLM_MODEL", "gpt-4o")
     
     response = client.chat.completions.create(
@@ -227,9 +413,9 @@ def _call_anthropic(prompt: str, model: Optional[str] = None) -> str:
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
     
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_anthropic_client(api_key)
     model = model or os.environ.get("LLM_MODEL", "claude-sonnet-4-20250514")
-    
+
     response = client.messages.create(
         model=model,
         max_tokens=8192,
@@ -251,12 +437,9 @@ def _call_minimax(prompt: str, model: Optional[str] = None) -> str:
     if not api_key:
         raise ValueError("MINIMAX_API_KEY environment variable not set")
     
-    client = OpenAI(
-        api_key=api_key,
-        base_url="https://api.minimax.chat/v1"
-    )
+    client = _get_openai_client(api_key, base_url="https://api.minimax.chat/v1")
     model = model or os.environ.get("LLM_MODEL", "MiniMax-Text-01")
-    
+
     response = client.chat.completions.create(
         model=model,
         messages=[
@@ -271,15 +454,12 @@ def _call_minimax(prompt: str, model: Optional[str] = None) -> str:
 
 def _call_ollama(prompt: str, model: Optional[str] = None) -> str:
     """Call local Ollama instance."""
-    try:
-        import requests
-    except ImportError:
-        raise ImportError("Requests not installed. Run: pip install cognitive[ollama]")
-    
+    session = _get_ollama_session()
+
     host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
     model = model or os.environ.get("LLM_MODEL", "llama3.1")
-    
-    response = requests.post(
+
+    response = session.post(
         f"{host}/api/generate",
         json={
             "model": model,
@@ -287,25 +467,25 @@ def _call_ollama(prompt: str, model: Optional[str] = None) -> str:
             "stream": False,
             "format": "json",
             "options": {"temperature": 0.2}
-        }
+        },
+        timeout=(5, 120)
     )
     response.raise_for_status()
     
     return response.json()["response"]
 
 
-def _call_stub(prompt: str) -> str:
-    """
-    Stub implementation for testing without LLM.
-    Returns example output if available.
-    """
-    # Try to find example output from a module
-    # This is a heuristic - look for cognitive/modules directories
+# (base dir mtimes signature, [(prompt prefix, output path), ...], automaton or None)
+_stub_index: Optional[tuple] = None
+
+
+def _build_stub_index() -> list:
+    """Scan the module search paths for (prompt prefix, example output) pairs."""
+    index = []
     search_paths = [
         Path.cwd() / "cognitive" / "modules",
         Path.home() / ".cognitive" / "modules",
     ]
-    
     for base in search_paths:
         if not base.exists():
             continue
@@ -317,11 +497,69 @@ def _call_stub(prompt: str) -> str:
             if prompt_file.exists() and output_file.exists():
                 with open(prompt_file, 'r') as f:
                     module_prompt = f.read()
-                # Check if this module's prompt is in the request
-                if module_prompt[:100] in prompt:
+                index.append((module_prompt[:100], output_file))
+    return index
+
+
+def _build_stub_automaton(index: list):
+    """Compile the prefixes into an Aho-Corasick automaton, if available."""
+    if ahocorasick is None or not index:
+        return None
+    automaton = ahocorasick.Automaton()
+    for prompt_prefix, output_file in index:
+        automaton.add_word(prompt_prefix, output_file)
+    automaton.make_automaton()
+    return automaton
+
+
+def _get_stub_index() -> tuple:
+    """Memoised stub index, rebuilt when a search-path directory changes."""
+    global _stub_index
+    signature = []
+    for base in (Path.cwd() / "cognitive" / "modules", Path.home() / ".cognitive" / "modules"):
+        try:
+            signature.append(base.stat().st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    signature = tuple(signature)
+
+    if _stub_index is None or _stub_index[0] != signature:
+        index = _build_stub_index()
+        _stub_index = (signature, index, _build_stub_automaton(index))
+    return _stub_index[1], _stub_index[2]
+
+
+def _call_stub(prompt: str) -> str:
+    """
+    Stub implementation for testing without LLM.
+    Returns example output if available.
+    """
+    # Prefer the build-time baked index: no filesystem scan at all
+    if _BAKED_STUB_INDEX is not None:
+        for prompt_prefix, output_file in _BAKED_STUB_INDEX.items():
+            if prompt_prefix in prompt:
+                try:
                     with open(output_file, 'r') as f:
                         return f.read()
-    
+                except OSError:
+                    continue
+
+    index, automaton = _get_stub_index()
+
+    if automaton is not None:
+        # Single pass over the prompt for all prefixes at once
+        candidates = (output_file for _, output_file in automaton.iter(prompt))
+    else:
+        candidates = (output_file for prompt_prefix, output_file in index
+                      if prompt_prefix in prompt)
+
+    for output_file in candidates:
+        try:
+            with open(output_file, 'r') as f:
+                return f.read()
+        except OSError:
+            continue
+
     # Fallback minimal response
     return json.dumps({
         "specification": {},
@@ -0,0 +1,79 @@
+"""
+LLM Response Cache - content-addressed disk cache for call_llm.
+
+Batch runs and deterministic tests send identical prompts over and over;
+caching responses avoids both the latency and the API cost of repeated
+calls. Entries are keyed by sha256(provider|model|prompt) and stored as
+plain files under ~/.cognitive/llm-cache.
+
+Opt in with LLM_CACHE=1. Entries expire after LLM_CACHE_TTL seconds
+(default: 86400).
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path.home() / ".cognitive" / "llm-cache"
+DEFAULT_TTL = 86400
+
+
+def cache_enabled() -> bool:
+    """Check whether the response cache is enabled via LLM_CACHE=1."""
+    return os.environ.get("LLM_CACHE") == "1"
+
+
+def cache_key(provider: str, model: Optional[str], prompt: str) -> str:
+    """Compute the content-addressed key for a (provider, model, prompt)."""
+    payload = f"{provider}|{model or ''}|{prompt}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached response for key, or None on miss/expiry."""
+    path = CACHE_DIR / key
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    ttl = int(os.environ.get("LLM_CACHE_TTL", DEFAULT_TTL))
+    if time.time() - stat.st_mtime > ttl:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def set(key: str, response: str) -> None:
+    """Store a response under key. Best-effort: I/O errors are ignored."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_DIR / f".{key}.tmp"
+        tmp.write_text(response, encoding="utf-8")
+        os.replace(tmp, CACHE_DIR / key)
+    except OSError:
+        pass
+
+
+def clear() -> int:
+    """Remove all cached responses. Returns the number of entries removed."""
+    removed = 0
+    try:
+        for entry in CACHE_DIR.iterdir():
+            try:
+                entry.unlink()
+                removed += 1
+            except OSError:
+                pass
+    except OSError:
+        pass
+    return removed
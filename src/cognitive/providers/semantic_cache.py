@@ -0,0 +1,141 @@
+"""
+Semantic Cache - embedding-similarity lookup for near-duplicate prompts.
+
+Complements the exact-match cache in llm_cache: prompts that differ only
+in whitespace, ordering, or phrasing embed close together, so a
+cosine-similarity hit above the threshold can skip the provider call
+entirely.
+
+Requires the optional sentence-transformers package (which brings numpy);
+when it is not installed the cache reports itself unavailable and
+call_llm falls through to the provider. Opt in with LLM_SEMANTIC_CACHE=1.
+The match threshold is LLM_SEMANTIC_THRESHOLD (default 0.92) and the
+embedding model is LLM_EMBED_MODEL (default all-MiniLM-L6-v2).
+Entries persist under ~/.cognitive/semantic-cache between runs.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path.home() / ".cognitive" / "semantic-cache"
+DEFAULT_THRESHOLD = 0.92
+DEFAULT_EMBED_MODEL = "all-MiniLM-L6-v2"
+
+# In-process state: L2-normalised embeddings matrix + parallel responses list
+_model = None
+_embeddings = None
+_responses: list = []
+_loaded = False
+
+
+def cache_enabled() -> bool:
+    """Check whether the semantic cache is enabled via LLM_SEMANTIC_CACHE=1."""
+    return os.environ.get("LLM_SEMANTIC_CACHE") == "1"
+
+
+def _get_model():
+    """Lazily load the sentence-transformers model; None when unavailable."""
+    global _model
+    if _model is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            return None
+        _model = SentenceTransformer(
+            os.environ.get("LLM_EMBED_MODEL", DEFAULT_EMBED_MODEL)
+        )
+    return _model
+
+
+def _encode(prompt: str):
+    """Embed and L2-normalise a prompt; None when the model is unavailable."""
+    model = _get_model()
+    if model is None:
+        return None
+    import numpy as np
+
+    embedding = np.asarray(model.encode([prompt])[0], dtype="float32")
+    norm = np.linalg.norm(embedding)
+    return embedding / norm if norm else embedding
+
+
+def _load() -> None:
+    """Load the persisted index on first use. Best-effort."""
+    global _embeddings, _responses, _loaded
+    if _loaded:
+        return
+    _loaded = True
+    try:
+        import numpy as np
+
+        _embeddings = np.load(CACHE_DIR / "embeddings.npy")
+        with open(CACHE_DIR / "responses.json", "r", encoding="utf-8") as f:
+            _responses = json.load(f)
+        if len(_responses) != len(_embeddings):
+            _embeddings, _responses = None, []
+    except Exception:
+        _embeddings, _responses = None, []
+
+
+def _save() -> None:
+    """Persist the index to disk. Best-effort."""
+    if _embeddings is None:
+        return
+    try:
+        import numpy as np
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.save(CACHE_DIR / "embeddings.npy", _embeddings)
+        tmp = CACHE_DIR / ".responses.json.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_responses, f)
+        os.replace(tmp, CACHE_DIR / "responses.json")
+    except Exception:
+        pass
+
+
+def lookup(prompt: str) -> Optional[str]:
+    """Return the cached response closest to prompt, or None below threshold."""
+    _load()
+    if _embeddings is None or not _responses:
+        return None
+    embedding = _encode(prompt)
+    if embedding is None:
+        return None
+
+    scores = _embeddings @ embedding
+    best = int(scores.argmax())
+    threshold = float(os.environ.get("LLM_SEMANTIC_THRESHOLD", DEFAULT_THRESHOLD))
+    if scores[best] >= threshold:
+        return _responses[best]
+    return None
+
+
+def store(prompt: str, response: str) -> None:
+    """Add a (prompt embedding, response) pair to the index."""
+    global _embeddings
+    embedding = _encode(prompt)
+    if embedding is None:
+        return
+    import numpy as np
+
+    _load()
+    if _embeddings is None:
+        _embeddings = embedding.reshape(1, -1)
+    else:
+        _embeddings = np.vstack([_embeddings, embedding])
+    _responses.append(response)
+    _save()
+
+
+def clear() -> None:
+    """Drop the in-process index and remove persisted files."""
+    global _embeddings, _responses, _loaded
+    _embeddings, _responses, _loaded = None, [], False
+    for name in ("embeddings.npy", "responses.json"):
+        try:
+            (CACHE_DIR / name).unlink()
+        except OSError:
+            pass
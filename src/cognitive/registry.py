@@ -15,14 +15,20 @@ import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from urllib.request import urlopen, Request
-from urllib.error import URLError
+from urllib.error import URLError, HTTPError
 import zipfile
-import io
 import re
 
+from . import _json
+
 # Standard module search paths
 SEARCH_PATHS = [
     Path.cwd() / "cognitive" / "modules",  # Project-local
@@ -39,30 +45,110 @@ DEFAULT_REGISTRY_URL = "https://raw.githubusercontent.com/ziel-io/cognitive-modu
 # Local registry cache
 REGISTRY_CACHE = Path.home() / ".cognitive" / "registry-cache.json"
 
+# Marker files identifying a module directory (v2 / v1 / v0 formats)
+_MARKERS = frozenset({"module.yaml", "MODULE.md", "module.md"})
 
-def get_search_paths() -> list[Path]:
-    """Get all module search paths, including custom paths from env."""
-    paths = SEARCH_PATHS.copy()
-    
-    # Add custom paths from environment
-    custom = os.environ.get("COGNITIVE_MODULES_PATH")
+
+def _has_module_marker(path) -> bool:
+    """True if the directory contains any module marker file.
+
+    One scandir (a single readdir) instead of three per-marker stats.
+    """
+    try:
+        with os.scandir(path) as it:
+            for e in it:
+                if e.name in _MARKERS:
+                    return True
+    except OSError:
+        # Missing, not a dir, or unreadable — all mean "no module here",
+        # matching the old Path.exists() probes
+        pass
+    return False
+
+
+@lru_cache(maxsize=4)
+def _search_paths_for(custom: Optional[str]) -> tuple[Path, ...]:
+    """Build the search-path tuple for a COGNITIVE_MODULES_PATH value.
+
+    Cached per env value so repeated find_module/list_modules calls skip
+    re-splitting the env var and re-building Path objects. Call
+    _search_paths_for.cache_clear() if SEARCH_PATHS is mutated (tests).
+    """
+    paths = list(SEARCH_PATHS)
     if custom:
         for p in custom.split(":"):
             paths.insert(0, Path(p))
-    
-    return paths
+    return tuple(paths)
+
+
+def get_search_paths() -> tuple[Path, ...]:
+    """Get all module search paths, including custom paths from env.
+
+    Returns the cached immutable tuple directly; no per-call copy.
+    """
+    return _search_paths_for(os.environ.get("COGNITIVE_MODULES_PATH"))
+
+
+# find_module results keyed by name, validated against the mtimes of the
+# search-path directories so installs/uninstalls invalidate entries
+_FIND_CACHE: dict[str, tuple[tuple, Optional[Path]]] = {}
+
+
+def _search_paths_signature(search_paths: tuple) -> tuple:
+    sig = []
+    for p in search_paths:
+        try:
+            sig.append(os.stat(p).st_mtime_ns)
+        except OSError:
+            sig.append(0)
+    return tuple(sig)
 
 
 def find_module(name: str) -> Optional[Path]:
-    """Find a module by name, searching all paths in order."""
-    for base_path in get_search_paths():
-        module_path = base_path / name
-        # Support v2, v1, and v0 formats
-        if module_path.exists():
-            if (module_path / "module.yaml").exists() or \
-               (module_path / "MODULE.md").exists() or \
-               (module_path / "module.md").exists():
-                return module_path
+    """Find a module by name, searching all paths in order.
+
+    Repeated lookups (run_module in a loop, MCP sessions) are answered
+    from a cache validated by the search-path directory mtimes, turning
+    up to a dozen stat probes into at most three.
+    """
+    search_paths = _search_paths_for(os.environ.get("COGNITIVE_MODULES_PATH"))
+    sig = _search_paths_signature(search_paths)
+    cached = _FIND_CACHE.get(name)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+
+    result = None
+    for base_path in search_paths:
+        # Single scandir per candidate; supports v2, v1, and v0 formats
+        if _has_module_marker(os.path.join(str(base_path), name)):
+            result = base_path / name
+            break
+
+    _FIND_CACHE[name] = (sig, result)
+    return result
+
+
+find_module.cache_clear = _FIND_CACHE.clear
+
+
+def _detect_entry_format(entry_path: str) -> Optional[str]:
+    """Detect a module directory's format: 'v2', 'v1', 'v0' or None.
+
+    A single scandir gives every child name from one readdir, replacing
+    up to three per-marker stat probes (the N+1 stat problem on large
+    or network-mounted module dirs).
+    """
+    try:
+        with os.scandir(entry_path) as it:
+            names = {e.name for e in it}
+    except OSError:
+        return None
+    if "module.yaml" in names:
+        return "v2"
+    if "MODULE.md" in names:
+        return "v1"
+    if "module.md" in names:
+        return "v0"
     return None
 
 
@@ -70,35 +156,43 @@ def list_modules() -> list[dict]:
     """List all available modules from all search paths."""
     modules = []
     seen = set()
-    
-    for base_path in get_search_paths():
-        if not base_path.exists():
+
+    for base_path in _search_paths_for(os.environ.get("COGNITIVE_MODULES_PATH")):
+        try:
+            # One scandir pass; DirEntry.is_dir reuses the dirent type,
+            # saving a stat per candidate compared to iterdir + is_dir
+            with os.scandir(base_path) as it:
+                entries = [
+                    e for e in it
+                    if e.is_dir(follow_symlinks=False)
+                    and not e.name.startswith(".")  # staging/trash dirs
+                    and e.name not in seen
+                ]
+        except OSError:
             continue
-        
-        for module_dir in base_path.iterdir():
-            if not module_dir.is_dir():
-                continue
-            if module_dir.name in seen:
-                continue
-            
-            # Detect format: v2, v1, or v0
-            if (module_dir / "module.yaml").exists():
-                fmt = "v2"
-            elif (module_dir / "MODULE.md").exists():
-                fmt = "v1"
-            elif (module_dir / "module.md").exists():
-                fmt = "v0"
-            else:
+
+        # Format detection is one readdir per entry — pure syscall latency,
+        # GIL released.  Probing entries concurrently turns N round trips
+        # into ~N/pool on slow (network) mounts; ex.map preserves
+        # submission order so dedup stays deterministic.
+        if len(entries) > 1:
+            with ThreadPoolExecutor(max_workers=min(16, len(entries))) as ex:
+                formats = list(ex.map(_detect_entry_format, (e.path for e in entries)))
+        else:
+            formats = [_detect_entry_format(e.path) for e in entries]
+
+        for entry, fmt in zip(entries, formats):
+            if fmt is None:
                 continue
-            
-            seen.add(module_dir.name)
+
+            seen.add(entry.name)
             modules.append({
-                "name": module_dir.name,
-                "path": module_dir,
+                "name": entry.name,
+                "path": Path(entry.path),
                 "location": "local" if base_path == SEARCH_PATHS[0] else "global",
                 "format": fmt,
             })
-    
+
     return modules
 
 
@@ -108,30 +202,121 @@ def ensure_user_modules_dir() -> Path:
     return USER_MODULES_DIR
 
 
-def install_from_local(source: Path, name: Optional[str] = None) -> Path:
-    """Install a module from a local path."""
-    source = Path(source).resolve()
+# Serializes the final staging -> target swap so concurrent installs
+# (cog install src1 src2 ...) can't race on the same module directory
+_INSTALL_LOCK = threading.Lock()
+
+
+def _prune_litter(tree: Path) -> None:
+    """Drop VCS and bytecode litter from a moved tree."""
+    for root, dirs, files in os.walk(tree, topdown=True):
+        for d in list(dirs):
+            if d in (".git", "__pycache__"):
+                shutil.rmtree(os.path.join(root, d), ignore_errors=True)
+                dirs.remove(d)
+        for f in files:
+            if f.endswith(".pyc"):
+                try:
+                    os.unlink(os.path.join(root, f))
+                except OSError:
+                    pass
+
+
+def _install_tree(
+    source: Path,
+    module_name: str,
+    validate: bool = False,
+    _allow_move: bool = False,
+) -> Path:
+    """Copy a module tree into the user modules dir via a staging swap.
+
+    With validate=True the source is validated before anything is copied,
+    so a broken module never performs the copy or clobbers an existing
+    install. The copy lands in a staging directory next to the target and
+    is renamed into place (same filesystem, O(1)).
+
+    _allow_move is set by installers whose source is a doomed temp
+    directory: the tree is renamed into staging when both sit on the same
+    filesystem (no data copy at all), falling back to the copy when the
+    rename crosses devices.
+    """
+    if validate:
+        # Local import: the validator imports this module for find_module
+        from .validator import validate_module
+        is_valid, errors, _warnings = validate_module(str(source))
+        if not is_valid:
+            detail = "\n".join(f"  - {e}" for e in errors)
+            raise ValueError(f"Module failed validation:\n{detail}")
+
+    target = ensure_user_modules_dir() / module_name
+    staging = target.parent / f".{module_name}.staging"
+    if staging.exists():
+        shutil.rmtree(staging)
+
+    moved = False
+    if _allow_move:
+        try:
+            os.rename(source, staging)
+        except OSError:
+            pass  # EXDEV or similar: fall back to the copy below
+        else:
+            moved = True
+            _prune_litter(staging)
+
+    if not moved:
+        # Plain copy skips the per-file copystat/utime/chmod of the default
+        # copy2; VCS and bytecode litter is filtered at scan time
+        shutil.copytree(
+            source,
+            staging,
+            copy_function=shutil.copy,
+            ignore=shutil.ignore_patterns(".git", "__pycache__", "*.pyc"),
+        )
+
+    with _INSTALL_LOCK:
+        if target.exists():
+            _discard_tree(target)
+        os.rename(staging, target)
+    return target
+
+
+def install_from_local(
+    source: Path,
+    name: Optional[str] = None,
+    validate: bool = False,
+    _allow_move: bool = False,
+) -> Path:
+    """Install a module from a local path.
+
+    _allow_move is internal, set by installers passing a temp-directory
+    source that may be consumed by a rename instead of copied.
+    """
+    # resolve() walks (and stats) every path component; only needed to
+    # anchor relative sources against the cwd
+    source = Path(source)
+    if not source.is_absolute():
+        source = source.resolve()
     if not source.exists():
         raise FileNotFoundError(f"Source not found: {source}")
-    
+
     # Check for valid module (v2, v1, or v0 format)
     if not _is_valid_module(source):
         raise ValueError(f"Not a valid module (missing module.yaml, MODULE.md, or module.md): {source}")
-    
+
     module_name = name or source.name
-    target = ensure_user_modules_dir() / module_name
-    
-    if target.exists():
-        shutil.rmtree(target)
-    
-    shutil.copytree(source, target)
-    
+    target = _install_tree(source, module_name, validate=validate, _allow_move=_allow_move)
+
     # Record source info for update tracking
     _record_module_source(module_name, source)
-    
+
     return target
 
 
+# Serializes the installed.json read-modify-write; concurrent installs
+# would otherwise drop each other's entries or collide on the tmp file
+_MANIFEST_LOCK = threading.Lock()
+
+
 def _record_module_source(
     name: str,
     source: Path,
@@ -144,34 +329,38 @@ def _record_module_source(
     """Record module source info for future updates."""
     manifest_path = Path.home() / ".cognitive" / "installed.json"
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Load existing manifest
-    manifest = {}
-    if manifest_path.exists():
-        try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
-        except:
-            pass
-    
+
     # Get current timestamp
     from datetime import datetime
     now = datetime.now().isoformat()
-    
-    # Update entry
-    manifest[name] = {
-        "source": str(source),
-        "github_url": github_url,
-        "module_path": module_path,
-        "tag": tag,
-        "branch": branch,
-        "version": version,
-        "installed_at": str(Path.home() / ".cognitive" / "modules" / name),
-        "installed_time": now,
-    }
-    
-    with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+
+    with _MANIFEST_LOCK:
+        # Load existing manifest
+        manifest = {}
+        if manifest_path.exists():
+            try:
+                with open(manifest_path, 'r') as f:
+                    manifest = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                pass
+
+        # Update entry
+        manifest[name] = {
+            "source": str(source),
+            "github_url": github_url,
+            "module_path": module_path,
+            "tag": tag,
+            "branch": branch,
+            "version": version,
+            "installed_at": str(Path.home() / ".cognitive" / "modules" / name),
+            "installed_time": now,
+        }
+
+        # Atomic swap so readers never see installed.json torn
+        tmp = manifest_path.with_suffix(".tmp")
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, manifest_path)
 
 
 def get_installed_module_info(name: str) -> Optional[dict]:
@@ -184,22 +373,23 @@ def get_installed_module_info(name: str) -> Optional[dict]:
         with open(manifest_path, 'r') as f:
             manifest = json.load(f)
         return manifest.get(name)
-    except:
+    except (json.JSONDecodeError, OSError):
         return None
 
 
 def get_module_version(module_path: Path) -> Optional[str]:
     """Extract version from a module's metadata."""
     import yaml
-    
+    from .loader import _YamlLoader
+
     # Try v2 format (module.yaml)
     yaml_path = module_path / "module.yaml"
     if yaml_path.exists():
         try:
             with open(yaml_path, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
             return data.get("version")
-        except:
+        except (OSError, yaml.YAMLError, AttributeError):
             pass
     
     # Try v1 format (MODULE.md with frontmatter)
@@ -214,9 +404,9 @@ def get_module_version(module_path: Path) -> Optional[str]:
             if content.startswith("---"):
                 parts = content.split("---", 2)
                 if len(parts) >= 3:
-                    meta = yaml.safe_load(parts[1])
+                    meta = yaml.load(parts[1], Loader=_YamlLoader)
                     return meta.get("version")
-        except:
+        except (OSError, yaml.YAMLError, AttributeError):
             pass
     
     return None
@@ -262,12 +452,17 @@ def update_module(name: str) -> tuple[Path, str, str]:
     return new_path, old_version, new_version
 
 
+# org/repo extraction for GitHub ZIP installs and tag listing, compiled once
+_GH_URL_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/?")
+
+
 def install_from_github_url(
     url: str,
     module_path: Optional[str] = None,
     name: Optional[str] = None,
     branch: str = "main",
     tag: Optional[str] = None,
+    validate: bool = False,
 ) -> Path:
     """
     Install a module from a GitHub URL without requiring git.
@@ -294,7 +489,7 @@ def install_from_github_url(
         url = f"https://github.com/{url}"
     
     # Extract org/repo from URL
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/?", url)
+    match = _GH_URL_RE.match(url)
     if not match:
         raise ValueError(f"Invalid GitHub URL: {url}")
     
@@ -309,69 +504,101 @@ def install_from_github_url(
     else:
         zip_url = f"https://github.com/{org}/{repo}/archive/refs/heads/{branch}.zip"
     
+    # Stream the archive straight to a temp file: peak memory stays at
+    # one 64 KiB buffer instead of the whole ZIP plus zipfile's copies
+    zip_fd = tempfile.NamedTemporaryFile(delete=False, suffix=".zip")
     try:
-        # Download ZIP
-        req = Request(zip_url, headers={"User-Agent": "cognitive-modules/1.0"})
-        with urlopen(req, timeout=30) as response:
-            zip_data = response.read()
-    except URLError as e:
-        if tag:
-            raise RuntimeError(f"Failed to download tag '{tag}' from GitHub: {e}")
-        raise RuntimeError(f"Failed to download from GitHub: {e}")
-    
+        try:
+            req = Request(zip_url, headers={"User-Agent": "cognitive-modules/1.0"})
+            with urlopen(req, timeout=30) as response:
+                shutil.copyfileobj(response, zip_fd, length=65536)
+            zip_fd.close()
+        except URLError as e:
+            if tag:
+                raise RuntimeError(f"Failed to download tag '{tag}' from GitHub: {e}")
+            raise RuntimeError(f"Failed to download from GitHub: {e}")
+
+        return _install_github_zip(
+            zip_fd.name, module_path, name, github_url, branch, tag, validate
+        )
+    finally:
+        zip_fd.close()
+        os.unlink(zip_fd.name)
+
+
+def _install_github_zip(
+    zip_path: str,
+    module_path: Optional[str],
+    name: Optional[str],
+    github_url: str,
+    branch: str,
+    tag: Optional[str],
+    validate: bool,
+) -> Path:
+    """Extract a downloaded GitHub archive and install the module from it."""
     # Extract to temp directory
     with tempfile.TemporaryDirectory() as tmpdir:
         tmppath = Path(tmpdir)
-        
-        # Extract ZIP
-        with zipfile.ZipFile(io.BytesIO(zip_data)) as zf:
-            zf.extractall(tmppath)
-        
-        # Find extracted directory (usually repo-branch or repo-tag)
-        extracted_dirs = list(tmppath.iterdir())
-        if not extracted_dirs:
-            raise RuntimeError("ZIP file was empty")
-        repo_root = extracted_dirs[0]
-        
-        # Determine source path
-        if module_path:
-            # Try different module path patterns
-            source = None
-            possible_paths = [
-                repo_root / module_path,
-                repo_root / "cognitive" / "modules" / module_path,
-                repo_root / "modules" / module_path,
-            ]
-            for p in possible_paths:
-                if p.exists() and _is_valid_module(p):
-                    source = p
+
+        with zipfile.ZipFile(zip_path) as zf:
+            names = zf.namelist()
+            if not names:
+                raise RuntimeError("ZIP file was empty")
+            # Archive root is repo-branch or repo-tag
+            root = names[0].split("/", 1)[0]
+
+            if module_path:
+                # Extract only the requested subtree; for a small module
+                # in a big repo this skips almost all of the archive.
+                # Try different module path patterns
+                candidates = [
+                    module_path,
+                    f"cognitive/modules/{module_path}",
+                    f"modules/{module_path}",
+                ]
+                members = []
+                rel_path = None
+                for candidate in candidates:
+                    prefix = f"{root}/{candidate}/"
+                    # A dir merely sharing the name isn't enough: require
+                    # a module marker so a non-module <name>/ at the repo
+                    # root doesn't shadow cognitive/modules/<name>/
+                    if not any(f"{prefix}{m}" in names for m in _MARKERS):
+                        continue
+                    members = [n for n in names if n.startswith(prefix)]
+                    rel_path = candidate
                     break
-            
-            if not source:
-                raise FileNotFoundError(
-                    f"Module not found at: {module_path}\n"
-                    f"Searched in: {[str(p.relative_to(repo_root)) for p in possible_paths]}"
-                )
-        else:
-            # Use repo root as module
-            source = repo_root
-            if not _is_valid_module(source):
-                raise ValueError(
-                    f"Repository root is not a valid module. "
-                    f"Use --module to specify the module path."
-                )
+
+                if not members:
+                    raise FileNotFoundError(
+                        f"Module not found at: {module_path}\n"
+                        f"Searched in: {candidates}"
+                    )
+
+                zf.extractall(tmppath, members=members)
+                source = tmppath / root / rel_path
+                if not _is_valid_module(source):
+                    raise FileNotFoundError(
+                        f"Module not found at: {module_path}\n"
+                        f"Searched in: {candidates}"
+                    )
+            else:
+                # Use repo root as module
+                zf.extractall(tmppath)
+                source = tmppath / root
+                if not _is_valid_module(source):
+                    raise ValueError(
+                        f"Repository root is not a valid module. "
+                        f"Use --module to specify the module path."
+                    )
         
         # Determine module name and version
         module_name = name or source.name
         version = get_module_version(source)
-        
-        # Install to user modules dir
-        target = ensure_user_modules_dir() / module_name
-        
-        if target.exists():
-            shutil.rmtree(target)
-        
-        shutil.copytree(source, target)
+
+        # Validate while still in the tempdir, then swap into place; the
+        # tempdir tree may be consumed by a rename instead of copied
+        target = _install_tree(source, module_name, validate=validate, _allow_move=True)
         
         # Record source info for future updates
         _record_module_source(
@@ -389,53 +616,106 @@ def install_from_github_url(
 
 def _is_valid_module(path: Path) -> bool:
     """Check if a directory is a valid cognitive module."""
-    return (
-        (path / "module.yaml").exists() or  # v2 format
-        (path / "MODULE.md").exists() or     # v1 format
-        (path / "module.md").exists()         # v0 format
+    return _has_module_marker(path)
+
+
+# Source-string shapes for install_from_git, compiled once
+_GITHUB_SHORTHAND_RE = re.compile(
+    r"^github:(?P<org>[^/]+)/(?P<repo>[^/]+)(?:/(?P<subdir>.+))?$"
+)
+_GIT_PLUS_RE = re.compile(r"^git\+(?P<url>[^#]+)(?:#(?P<fragment>.*))?$")
+_SUBDIR_PARAM_RE = re.compile(r"(?:^|&)subdir=(?P<subdir>[^&]*)")
+_GH_REPO_RE = re.compile(
+    r"^https://github\.com/(?P<org>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$"
+)
+
+
+def _run_git(cmd: list) -> subprocess.CompletedProcess:
+    """Run a git command, capturing raw bytes.
+
+    Output stays undecoded (we only decode stderr on failure), and
+    GIT_TERMINAL_PROMPT=0 makes bad URLs fail fast instead of hanging
+    on a credential prompt.
+    """
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
     )
 
 
-def install_from_git(url: str, subdir: Optional[str] = None, name: Optional[str] = None) -> Path:
+def install_from_git(url: str, subdir: Optional[str] = None, name: Optional[str] = None, validate: bool = False) -> Path:
     """
     Install a module from a git repository.
-    
+
     Supports:
     - github:org/repo/path/to/module
     - git+https://github.com/org/repo#subdir=path/to/module
     - https://github.com/org/repo (with subdir parameter)
     """
-    # Parse github: shorthand
+    # Parse github: shorthand in one pass
     if url.startswith("github:"):
-        parts = url[7:].split("/", 2)
-        if len(parts) < 2:
+        m = _GITHUB_SHORTHAND_RE.match(url)
+        if not m:
             raise ValueError(f"Invalid github URL: {url}")
-        org, repo = parts[0], parts[1]
-        if len(parts) == 3:
-            subdir = parts[2]
-        url = f"https://github.com/{org}/{repo}.git"
-    
+        if m["subdir"]:
+            subdir = m["subdir"]
+        url = f"https://github.com/{m['org']}/{m['repo']}.git"
+
     # Parse git+https:// with fragment
     elif url.startswith("git+"):
-        url = url[4:]
-        if "#" in url:
-            url, fragment = url.split("#", 1)
-            for part in fragment.split("&"):
-                if part.startswith("subdir="):
-                    subdir = part[7:]
-    
+        m = _GIT_PLUS_RE.match(url)
+        url = m["url"]
+        if m["fragment"]:
+            sm = _SUBDIR_PARAM_RE.search(m["fragment"])
+            if sm:
+                subdir = sm["subdir"]
+    
+    # github.com repos take the ZIP fast path: one HTTPS GET, no git
+    # binary, no refs negotiation. The archive URL assumes branch main,
+    # so fall through to the clone below (which fetches the repo's
+    # default branch) when the download fails or the module isn't in
+    # the main archive.
+    gh = _GH_REPO_RE.match(url)
+    if gh:
+        try:
+            return install_from_github_url(
+                f"https://github.com/{gh['org']}/{gh['repo']}",
+                module_path=subdir,
+                name=name,
+                validate=validate,
+            )
+        except (RuntimeError, FileNotFoundError, ValueError):
+            pass
+
     # Clone to temp directory
     with tempfile.TemporaryDirectory() as tmpdir:
         tmppath = Path(tmpdir)
-        
-        # Shallow clone
-        result = subprocess.run(
-            ["git", "clone", "--depth", "1", url, str(tmppath / "repo")],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Git clone failed: {result.stderr}")
+        repo_dir = str(tmppath / "repo")
+
+        cloned = False
+        if subdir:
+            # Partial + sparse clone: fetch only the requested subdir's
+            # blobs instead of the whole tree (big win on monorepos)
+            result = _run_git(
+                ["git", "clone", "--depth", "1", "--filter=blob:none",
+                 "--sparse", url, repo_dir]
+            )
+            if result.returncode == 0:
+                result = _run_git(
+                    ["git", "-C", repo_dir, "sparse-checkout", "set", subdir]
+                )
+                cloned = result.returncode == 0
+            if not cloned:
+                # Old git or server without partial-clone support
+                shutil.rmtree(repo_dir, ignore_errors=True)
+
+        if not cloned:
+            # Shallow clone
+            result = _run_git(["git", "clone", "--depth", "1", url, repo_dir])
+            if result.returncode != 0:
+                stderr = result.stderr.decode("utf-8", errors="replace")
+                raise RuntimeError(f"Git clone failed: {stderr}")
         
         # Find module source
         source = tmppath / "repo"
@@ -449,29 +729,29 @@ def install_from_git(url: str, subdir: Optional[str] = None, name: Optional[str]
         module_name = name or source.name
         
         # Install from cloned source
-        return install_from_local(source, module_name)
+        return install_from_local(source, module_name, validate=validate, _allow_move=True)
 
 
-def install_from_registry(module_name: str) -> Path:
+def install_from_registry(module_name: str, validate: bool = False) -> Path:
     """Install a module from the public registry."""
     registry = fetch_registry()
-    
+
     if module_name not in registry.get("modules", {}):
         raise ValueError(f"Module not found in registry: {module_name}")
-    
+
     module_info = registry["modules"][module_name]
     source = module_info.get("source")
-    
+
     if not source:
         raise ValueError(f"No source defined for module: {module_name}")
-    
-    return install_module(source, name=module_name)
+
+    return install_module(source, name=module_name, validate=validate)
 
 
-def install_module(source: str, name: Optional[str] = None) -> Path:
+def install_module(source: str, name: Optional[str] = None, validate: bool = False) -> Path:
     """
     Install a module from various sources.
-    
+
     Sources:
     - local:/path/to/module
     - github:org/repo/path/to/module
@@ -479,57 +759,186 @@ def install_module(source: str, name: Optional[str] = None) -> Path:
     - /absolute/path (treated as local)
     - ./relative/path (treated as local)
     - registry:module-name (from public registry)
+
+    With validate=True sources are validated before being copied into the
+    user modules directory, so a failing module never replaces an
+    existing install.
     """
     if source.startswith("local:"):
-        return install_from_local(Path(source[6:]), name)
+        return install_from_local(Path(source[6:]), name, validate=validate)
     elif source.startswith("registry:"):
-        return install_from_registry(source[9:])
+        return install_from_registry(source[9:], validate=validate)
     elif source.startswith("github:") or source.startswith("git+"):
-        return install_from_git(source, name=name)
+        return install_from_git(source, name=name, validate=validate)
     elif source.startswith("/") or source.startswith("./") or source.startswith(".."):
-        return install_from_local(Path(source), name)
+        return install_from_local(Path(source), name, validate=validate)
     elif source.startswith("https://github.com"):
-        return install_from_git(source, name=name)
+        return install_from_git(source, name=name, validate=validate)
     else:
         # Try registry first, then local
         try:
-            return install_from_registry(source)
-        except:
-            return install_from_local(Path(source), name)
+            return install_from_registry(source, validate=validate)
+        except (ValueError, KeyError):
+            return install_from_local(Path(source), name, validate=validate)
+
+
+def _sweep_trash(trash: Path) -> None:
+    """Best-effort removal of every tree parked in the trash dir.
+
+    Besides the freshly renamed grave, this reclaims orphans left behind
+    when a previous process exited before its deleter thread finished.
+    """
+    try:
+        with os.scandir(trash) as it:
+            graves = [e.path for e in it]
+    except OSError:
+        return
+    for grave in graves:
+        shutil.rmtree(grave, ignore_errors=True)
+
+
+def _discard_tree(target: Path) -> None:
+    """Remove a module tree without blocking on the deletion.
+
+    The tree is renamed into a hidden trash directory (one atomic rename,
+    O(1) regardless of file count) and deleted by a background thread,
+    which also sweeps any orphans from earlier runs. The trash dir is
+    dot-prefixed, so list_modules never sees it. Falls back to a blocking
+    rmtree when the rename fails (e.g. trash on a different filesystem).
+    """
+    trash = USER_MODULES_DIR / ".trash"
+    try:
+        trash.mkdir(parents=True, exist_ok=True)
+        grave = trash / f"{target.name}-{uuid.uuid4().hex}"
+        os.rename(target, grave)
+    except OSError:
+        shutil.rmtree(target)
+        return
+    threading.Thread(target=_sweep_trash, args=(trash,), daemon=True).start()
 
 
 def uninstall_module(name: str) -> bool:
     """Uninstall a module from user global location."""
     target = USER_MODULES_DIR / name
     if target.exists():
-        shutil.rmtree(target)
+        _discard_tree(target)
         return True
     return False
 
 
+# Registry cache freshness windows (seconds): younger than FRESH is
+# served as-is, younger than STALE is served while a background thread
+# refreshes, older than STALE blocks on a fetch
+_REGISTRY_FRESH_TTL = 600
+_REGISTRY_STALE_TTL = 3 * 86400
+
+_REGISTRY_REFRESH_LOCK = threading.Lock()
+
+
+def _read_registry_cache() -> Optional[dict]:
+    """Read the cache envelope {data, etag, last_modified, fetched_at}.
+
+    Pre-envelope caches (bare registry JSON) are wrapped on the fly with
+    the file mtime standing in for fetched_at.
+    """
+    try:
+        st = REGISTRY_CACHE.stat()
+        cached = _json.loads(REGISTRY_CACHE.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if isinstance(cached, dict) and "data" in cached and "fetched_at" in cached:
+        return cached
+    return {
+        "data": cached,
+        "etag": None,
+        "last_modified": None,
+        "fetched_at": st.st_mtime,
+    }
+
+
+def _write_registry_cache(envelope: dict) -> None:
+    # Write-then-rename so a crash mid-write (or a concurrent reader)
+    # never sees a truncated cache file
+    REGISTRY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = REGISTRY_CACHE.with_suffix(".tmp")
+    tmp.write_bytes(_json.dumps_bytes(envelope))
+    os.replace(tmp, REGISTRY_CACHE)
+
+
+def _refresh_registry(url: str) -> dict:
+    """Revalidate or fetch the registry and rewrite the cache file.
+
+    Sends If-None-Match / If-Modified-Since when the cache carries the
+    matching validators; a 304 answer keeps the cached data and only
+    touches fetched_at, transferring no registry bytes.
+    """
+    cached = _read_registry_cache()
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        with urlopen(Request(url, headers=headers), timeout=5) as response:
+            data = _json.loads(response.read())
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+    except HTTPError as e:
+        if e.code == 304 and cached:
+            cached["fetched_at"] = time.time()
+            _write_registry_cache(cached)
+            return cached["data"]
+        raise
+
+    _write_registry_cache({
+        "data": data,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": time.time(),
+    })
+    return data
+
+
+def _refresh_registry_background(url: str) -> None:
+    """Best-effort refresh; skipped if another refresh is in flight."""
+    if not _REGISTRY_REFRESH_LOCK.acquire(blocking=False):
+        return
+    try:
+        _refresh_registry(url)
+    except (URLError, OSError, json.JSONDecodeError):
+        pass
+    finally:
+        _REGISTRY_REFRESH_LOCK.release()
+
+
 def fetch_registry(url: Optional[str] = None, use_cache: bool = True) -> dict:
-    """Fetch the public module registry."""
+    """Fetch the public module registry.
+
+    Stale-while-revalidate: a fresh cache is returned directly, a stale
+    one is returned immediately while a daemon thread refreshes it, and
+    only a missing or very old cache blocks on the HTTP round-trip.
+    """
     url = url or os.environ.get("COGNITIVE_REGISTRY_URL", DEFAULT_REGISTRY_URL)
-    
-    # Try cache first
-    if use_cache and REGISTRY_CACHE.exists():
-        try:
-            with open(REGISTRY_CACHE, 'r') as f:
-                return json.load(f)
-        except:
-            pass
-    
-    # Fetch from URL
+
+    if use_cache:
+        cached = _read_registry_cache()
+        if cached is not None:
+            age = time.time() - cached["fetched_at"]
+            if age < _REGISTRY_FRESH_TTL:
+                return cached["data"]
+            if age < _REGISTRY_STALE_TTL:
+                threading.Thread(
+                    target=_refresh_registry_background, args=(url,),
+                    daemon=True,
+                ).start()
+                return cached["data"]
+            # Older than STALE_TTL: fall through to a blocking fetch
+
     try:
-        with urlopen(url, timeout=5) as response:
-            data = json.loads(response.read().decode())
-        
-        # Cache it
-        REGISTRY_CACHE.parent.mkdir(parents=True, exist_ok=True)
-        with open(REGISTRY_CACHE, 'w') as f:
-            json.dump(data, f)
-        
-        return data
+        with _REGISTRY_REFRESH_LOCK:
+            return _refresh_registry(url)
     except (URLError, json.JSONDecodeError) as e:
         # Return empty registry if fetch fails
         return {"modules": {}, "error": str(e)}
@@ -568,7 +977,7 @@ def list_github_tags(url: str, limit: int = 10) -> list[str]:
     if not url.startswith("http"):
         url = f"https://github.com/{url}"
     
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/?", url)
+    match = _GH_URL_RE.match(url)
     if not match:
         raise ValueError(f"Invalid GitHub URL: {url}")
     
@@ -584,7 +993,7 @@ def list_github_tags(url: str, limit: int = 10) -> list[str]:
             "Accept": "application/vnd.github.v3+json",
         })
         with urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode())
+            data = _json.loads(response.read())
         return [tag["name"] for tag in data]
     except URLError as e:
         return []
@@ -16,14 +16,17 @@ v2.2.1 Features:
 """
 
 import copy
+import hashlib
 import json
 import time
 from pathlib import Path
 from typing import Optional, TypedDict, Union, Literal, Callable, Iterator
 
-import jsonschema
-import yaml
+# jsonschema and yaml are imported lazily at their use sites: both are
+# only needed on fallback paths (uncompiled schemas, missing raw
+# constraints) and deferring them keeps CLI cold-start light
 
+from . import _json
 from .registry import find_module
 from .loader import load_module
 from .providers import call_llm
@@ -397,11 +400,55 @@ def make_success_response(
 # Schema Validation
 # =============================================================================
 
-def validate_data(data: dict, schema: dict, label: str = "Data") -> list[str]:
-    """Validate data against schema. Returns list of errors."""
+# Validation results keyed by (validator id, canonical data digest); the
+# validator is kept in the value so id reuse after gc cannot alias entries
+_VALIDATION_MEMO: dict[tuple[int, str], tuple] = {}
+_VALIDATION_MEMO_MAX = 1024
+
+
+def validate_data(
+    data: dict,
+    schema: dict,
+    label: str = "Data",
+    validator=None,
+) -> list[str]:
+    """
+    Validate data against schema. Returns list of errors.
+
+    When a precompiled validator (see loader.build_schema_validator) is
+    provided, it is reused instead of recompiling the schema per call,
+    and results are memoised so identical payloads (retries, idempotent
+    re-runs, tests) skip the schema walk entirely.
+    """
     errors = []
     if not schema:
         return errors
+    if validator is not None:
+        memo_key = None
+        try:
+            digest = hashlib.sha256(_json.dumps_bytes(data, sort_keys=True)).hexdigest()
+            memo_key = (id(validator), digest)
+        except (TypeError, ValueError):
+            pass  # Unserialisable payload - validate without memoisation
+
+        if memo_key is not None:
+            hit = _VALIDATION_MEMO.get(memo_key)
+            if hit is not None and hit[0] is validator:
+                return [f"{label} validation error: {m} at {p}" for m, p in hit[1]]
+
+        # is_valid is the cheap path; only collect errors on failure
+        if validator.is_valid(data):
+            pairs = []
+        else:
+            pairs = [(e.message, list(e.absolute_path)) for e in validator.iter_errors(data)]
+
+        if memo_key is not None:
+            if len(_VALIDATION_MEMO) >= _VALIDATION_MEMO_MAX:
+                _VALIDATION_MEMO.clear()
+            _VALIDATION_MEMO[memo_key] = (validator, pairs)
+
+        return [f"{label} validation error: {m} at {p}" for m, p in pairs]
+    import jsonschema
     try:
         jsonschema.validate(instance=data, schema=schema)
     except jsonschema.ValidationError as e:
@@ -636,46 +683,62 @@ def substitute_arguments(text: str, input_data: dict) -> str:
     return text
 
 
+# Constant prompt tails, pre-joined once instead of per call
+_ENVELOPE_V22_TAIL = (
+    "\n## Response Format (Envelope v2.2)\n"
+    "You MUST wrap your response in the v2.2 envelope format with separate meta and data:\n"
+    "- Success: { \"ok\": true, \"meta\": { \"confidence\": 0.9, \"risk\": \"low\", \"explain\": \"short summary\" }, \"data\": { ...payload... } }\n"
+    "- Error: { \"ok\": false, \"meta\": { \"confidence\": 0.0, \"risk\": \"high\", \"explain\": \"error summary\" }, \"error\": { \"code\": \"ERROR_CODE\", \"message\": \"...\" } }\n"
+    "Note: meta.explain must be ≤280 characters. data.rationale can be longer for detailed reasoning.\n"
+    "Return ONLY valid JSON.\n"
+)
+
+_ENVELOPE_TAIL = (
+    "\n## Response Format (Envelope)\n"
+    "You MUST wrap your response in the envelope format:\n"
+    "- Success: { \"ok\": true, \"data\": { ...your output... } }\n"
+    "- Error: { \"ok\": false, \"error\": { \"code\": \"ERROR_CODE\", \"message\": \"...\" } }\n"
+    "Return ONLY valid JSON.\n"
+)
+
+_PLAIN_TAIL = (
+    "\n## Instructions\n"
+    "Analyze the input and generate output matching the required schema."
+    "Return ONLY valid JSON. Do not include any text before or after the JSON."
+)
+
+
 def build_prompt(module: dict, input_data: dict, use_envelope: bool = False, use_v22: bool = False) -> str:
     """Build the complete prompt for the LLM."""
     # Substitute $ARGUMENTS in prompt
     prompt = substitute_arguments(module["prompt"], input_data)
-    
+
+    # Loaders precompute constraints_yaml; dumping here only happens for
+    # module dicts built by hand (tests, embedding callers)
+    constraints_yaml = module.get("constraints_yaml")
+    if constraints_yaml is None:
+        import yaml
+        from .loader import _YamlDumper
+        constraints_yaml = yaml.dump(
+            module["constraints"], Dumper=_YamlDumper, default_flow_style=False
+        )
+        module["constraints_yaml"] = constraints_yaml
+
+    if use_envelope:
+        tail = _ENVELOPE_V22_TAIL if use_v22 else _ENVELOPE_TAIL
+    else:
+        tail = _PLAIN_TAIL
+
     parts = [
         prompt,
         "\n\n## Constraints\n",
-        yaml.dump(module["constraints"], default_flow_style=False),
-        "\n\n## Input\n",
-        "```json\n",
-        json.dumps(input_data, indent=2, ensure_ascii=False),
+        constraints_yaml,
+        "\n\n## Input\n```json\n",
+        _json.dumps(input_data, indent=True),
         "\n```\n",
+        tail,
     ]
-    
-    if use_envelope:
-        if use_v22:
-            parts.extend([
-                "\n## Response Format (Envelope v2.2)\n",
-                "You MUST wrap your response in the v2.2 envelope format with separate meta and data:\n",
-                "- Success: { \"ok\": true, \"meta\": { \"confidence\": 0.9, \"risk\": \"low\", \"explain\": \"short summary\" }, \"data\": { ...payload... } }\n",
-                "- Error: { \"ok\": false, \"meta\": { \"confidence\": 0.0, \"risk\": \"high\", \"explain\": \"error summary\" }, \"error\": { \"code\": \"ERROR_CODE\", \"message\": \"...\" } }\n",
-                "Note: meta.explain must be ≤280 characters. data.rationale can be longer for detailed reasoning.\n",
-                "Return ONLY valid JSON.\n",
-            ])
-        else:
-            parts.extend([
-                "\n## Response Format (Envelope)\n",
-                "You MUST wrap your response in the envelope format:\n",
-                "- Success: { \"ok\": true, \"data\": { ...your output... } }\n",
-                "- Error: { \"ok\": false, \"error\": { \"code\": \"ERROR_CODE\", \"message\": \"...\" } }\n",
-                "Return ONLY valid JSON.\n",
-            ])
-    else:
-        parts.extend([
-            "\n## Instructions\n",
-            "Analyze the input and generate output matching the required schema.",
-            "Return ONLY valid JSON. Do not include any text before or after the JSON.",
-        ])
-    
+
     return "".join(parts)
 
 
@@ -683,22 +746,26 @@ def build_prompt(module: dict, input_data: dict, use_envelope: bool = False, use
 # LLM Response Parsing
 # =============================================================================
 
+
 def parse_llm_response(response: str) -> dict:
     """Parse LLM response, handling potential markdown code blocks."""
     text = response.strip()
-    
-    # Remove markdown code blocks if present
+
+    # Remove markdown code blocks if present; two find calls are single
+    # C-level scans, no per-line allocation.  Search forward for the
+    # first closing fence so trailing prose or a second fenced block
+    # after the JSON doesn't get swept into the slice.
     if text.startswith("```"):
-        lines = text.split("\n")
-        start = 1
-        end = len(lines) - 1
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == "```":
-                end = i
-                break
-        text = "\n".join(lines[start:end])
-    
-    return json.loads(text)
+        first_nl = text.find("\n")
+        end = text.find("\n```", first_nl) if first_nl != -1 else -1
+        if first_nl != -1 and end > first_nl:
+            text = text[first_nl + 1:end]
+        else:
+            # No closing fence: drop the opening and trailing lines as before
+            lines = text.split("\n")
+            text = "\n".join(lines[1:-1])
+
+    return _json.loads(text)
 
 
 # =============================================================================
@@ -779,7 +846,7 @@ def run_module(
         
         # Validate input
         if validate_input and module.get("input_schema"):
-            errors = validate_data(input_data, module["input_schema"], "Input")
+            errors = validate_data(input_data, module["input_schema"], "Input", validator=module.get("input_validator"))
             if errors:
                 result = make_error_response(
                     code="INVALID_INPUT",
@@ -840,7 +907,9 @@ def run_module(
         if result.get("ok") and validate_output:
             # Get data schema (support both "data" and "output" aliases)
             data_schema = module.get("data_schema") or module.get("output_schema")
+            data_validator = module.get("data_validator") or module.get("output_validator")
             meta_schema = module.get("meta_schema")
+            meta_validator = module.get("meta_validator")
             
             # Get risk_rule from module.yaml meta config
             meta_config = module.get("metadata", {}).get("meta", {})
@@ -848,7 +917,7 @@ def run_module(
             
             if data_schema:
                 data_to_validate = result.get("data", {})
-                errors = validate_data(data_to_validate, data_schema, "Data")
+                errors = validate_data(data_to_validate, data_schema, "Data", validator=data_validator)
                 
                 if errors and enable_repair:
                     # Attempt repair pass
@@ -856,7 +925,7 @@ def run_module(
                     result["version"] = ENVELOPE_VERSION
                     
                     # Re-validate after repair
-                    errors = validate_data(result.get("data", {}), data_schema, "Data")
+                    errors = validate_data(result.get("data", {}), data_schema, "Data", validator=data_validator)
                 
                 if errors:
                     err_result = make_error_response(
@@ -871,12 +940,12 @@ def run_module(
             
             # Validate meta if schema exists
             if meta_schema:
-                meta_errors = validate_data(result.get("meta", {}), meta_schema, "Meta")
+                meta_errors = validate_data(result.get("meta", {}), meta_schema, "Meta", validator=meta_validator)
                 if meta_errors and enable_repair:
                     result = repair_envelope(result, meta_schema, risk_rule=risk_rule)
                     result["version"] = ENVELOPE_VERSION
                     # Re-validate meta after repair
-                    meta_errors = validate_data(result.get("meta", {}), meta_schema, "Meta")
+                    meta_errors = validate_data(result.get("meta", {}), meta_schema, "Meta", validator=meta_validator)
                     if meta_errors:
                         err_result = make_error_response(
                             code="META_VALIDATION_FAILED",
@@ -914,6 +983,19 @@ def run_module(
         return result
 
 
+async def arun_module(name_or_path: str, input_data: dict, **kwargs) -> dict:
+    """
+    Async wrapper around run_module for concurrent batch execution.
+
+    The pipeline itself is cheap; the time is spent blocked on the LLM
+    call, so running it in a worker thread lets callers overlap many
+    module executions with asyncio.gather. Accepts the same keyword
+    arguments as run_module.
+    """
+    import asyncio
+    return await asyncio.to_thread(run_module, name_or_path, input_data, **kwargs)
+
+
 def run_module_legacy(
     name_or_path: str,
     input_data: dict,
@@ -1032,7 +1114,7 @@ def run_module_stream(
         
         # Validate input
         if validate_input and module.get("input_schema"):
-            errors = validate_data(input_data, module["input_schema"], "Input")
+            errors = validate_data(input_data, module["input_schema"], "Input", validator=module.get("input_validator"))
             if errors:
                 error_result = make_error_response(
                     code="INVALID_INPUT",
@@ -1099,18 +1181,20 @@ def run_module_stream(
         # Validate and repair
         if result.get("ok") and validate_output:
             data_schema = module.get("data_schema") or module.get("output_schema")
+            data_validator = module.get("data_validator") or module.get("output_validator")
             meta_schema = module.get("meta_schema")
+            meta_validator = module.get("meta_validator")
             meta_config = module.get("metadata", {}).get("meta", {})
             risk_rule = meta_config.get("risk_rule", "max_changes_risk")
             
             if data_schema:
-                errors = validate_data(result.get("data", {}), data_schema, "Data")
+                errors = validate_data(result.get("data", {}), data_schema, "Data", validator=data_validator)
                 
                 if errors and enable_repair:
                     result = repair_envelope(result, meta_schema, risk_rule=risk_rule)
                     result["version"] = ENVELOPE_VERSION
                     # Re-validate after repair
-                    errors = validate_data(result.get("data", {}), data_schema, "Data")
+                    errors = validate_data(result.get("data", {}), data_schema, "Data", validator=data_validator)
                 
                 if errors:
                     error_result = make_error_response(
@@ -1126,11 +1210,11 @@ def run_module_stream(
             
             # Validate meta if schema exists
             if meta_schema:
-                meta_errors = validate_data(result.get("meta", {}), meta_schema, "Meta")
+                meta_errors = validate_data(result.get("meta", {}), meta_schema, "Meta", validator=meta_validator)
                 if meta_errors and enable_repair:
                     result = repair_envelope(result, meta_schema, risk_rule=risk_rule)
                     result["version"] = ENVELOPE_VERSION
-                    meta_errors = validate_data(result.get("meta", {}), meta_schema, "Meta")
+                    meta_errors = validate_data(result.get("meta", {}), meta_schema, "Meta", validator=meta_validator)
                     if meta_errors:
                         error_result = make_error_response(
                             code="META_VALIDATION_FAILED",
@@ -153,7 +153,7 @@ class SubagentOrchestrator:
             
             # Validate input
             if validate_input and module["input_schema"]:
-                errors = validate_data(input_data, module["input_schema"], "Input")
+                errors = validate_data(input_data, module["input_schema"], "Input", validator=module.get("input_validator"))
                 if errors:
                     raise ValueError(f"Input validation failed: {errors}")
             
@@ -213,7 +213,7 @@ class SubagentOrchestrator:
             
             # Validate output
             if validate_output and module["output_schema"]:
-                errors = validate_data(output_data, module["output_schema"], "Output")
+                errors = validate_data(output_data, module["output_schema"], "Output", validator=module.get("output_validator"))
                 if errors:
                     raise ValueError(f"Output validation failed: {errors}")
             
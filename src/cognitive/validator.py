@@ -4,12 +4,15 @@ Supports v0, v1, v2.1, and v2.2 module formats.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Optional, Literal
 
-import jsonschema
-import yaml
+# yaml is imported lazily inside the format validators so that importing
+# this module (e.g. for CLI listing) stays cheap
 
+from . import _json
+from .loader import build_schema_validator
 from .registry import find_module
 
 
@@ -17,6 +20,28 @@ from .registry import find_module
 # Main Validation Entry Point
 # =============================================================================
 
+# Validation results keyed by (path, v22) and guarded by a recursive
+# mtime/size signature, mirroring the loader's module cache: repeat
+# validations of an unchanged module (install + run, validate --all in
+# a watch loop) skip the re-read and re-parse entirely
+_VALIDATE_CACHE: dict[tuple[str, bool], tuple[tuple, tuple[bool, tuple, tuple]]] = {}
+
+
+def _tree_signature(module_path: Path) -> tuple:
+    """Signature of every file in the module tree (schema, examples included)."""
+    sig = []
+    for root, dirs, files in os.walk(module_path):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+        for fname in sorted(files):
+            fpath = os.path.join(root, fname)
+            try:
+                st = os.stat(fpath)
+            except OSError:
+                continue
+            sig.append((os.path.relpath(fpath, module_path), st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
 def validate_module(
     name_or_path: str,
     v22: bool = False
@@ -34,7 +59,7 @@ def validate_module(
     """
     errors = []
     warnings = []
-    
+
     # Find module
     path = Path(name_or_path)
     if path.exists() and path.is_dir():
@@ -43,32 +68,44 @@ def validate_module(
         module_path = find_module(name_or_path)
         if not module_path:
             return False, [f"Module not found: {name_or_path}"], []
-    
+
+    cache_key = (str(module_path), v22)
+    sig = _tree_signature(module_path)
+    cached = _VALIDATE_CACHE.get(cache_key)
+    if cached is not None and cached[0] == sig:
+        ok, errs, warns = cached[1]
+        return ok, list(errs), list(warns)
+
     # Detect format
     has_module_yaml = (module_path / "module.yaml").exists()
     has_module_md = (module_path / "MODULE.md").exists()
     has_old_module_md = (module_path / "module.md").exists()
-    
+
     if has_module_yaml:
         # v2.x format
         if v22:
-            return _validate_v22_format(module_path)
+            result = _validate_v22_format(module_path)
         else:
-            return _validate_v2_format(module_path)
+            result = _validate_v2_format(module_path)
     elif has_module_md:
         # v1 format
         if v22:
             errors.append("Module is v1 format. Use 'cogn migrate' to upgrade to v2.2")
-            return False, errors, warnings
-        return _validate_new_format(module_path)
+            result = (False, errors, warnings)
+        else:
+            result = _validate_new_format(module_path)
     elif has_old_module_md:
         # v0 format
         if v22:
             errors.append("Module is v0 format. Use 'cogn migrate' to upgrade to v2.2")
-            return False, errors, warnings
-        return _validate_old_format(module_path)
+            result = (False, errors, warnings)
+        else:
+            result = _validate_old_format(module_path)
     else:
-        return False, ["Missing module.yaml, MODULE.md, or module.md"], []
+        result = (False, ["Missing module.yaml, MODULE.md, or module.md"], [])
+
+    _VALIDATE_CACHE[cache_key] = (sig, (result[0], tuple(result[1]), tuple(result[2])))
+    return result
 
 
 # =============================================================================
@@ -77,6 +114,8 @@ def validate_module(
 
 def _validate_v22_format(module_path: Path) -> tuple[bool, list[str], list[str]]:
     """Validate v2.2 format (module.yaml + prompt.md + schema.json with meta)."""
+    import yaml
+    from .loader import _YamlLoader
     errors = []
     warnings = []
     
@@ -84,7 +123,7 @@ def _validate_v22_format(module_path: Path) -> tuple[bool, list[str], list[str]]
     module_yaml = module_path / "module.yaml"
     try:
         with open(module_yaml, 'r', encoding='utf-8') as f:
-            manifest = yaml.safe_load(f)
+            manifest = yaml.load(f, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         errors.append(f"Invalid YAML in module.yaml: {e}")
         return False, errors, warnings
@@ -228,6 +267,8 @@ def _validate_v22_format(module_path: Path) -> tuple[bool, list[str], list[str]]
 
 def _validate_v2_format(module_path: Path) -> tuple[bool, list[str], list[str]]:
     """Validate v2.x format without strict v2.2 requirements."""
+    import yaml
+    from .loader import _YamlLoader
     errors = []
     warnings = []
     
@@ -235,7 +276,7 @@ def _validate_v2_format(module_path: Path) -> tuple[bool, list[str], list[str]]:
     module_yaml = module_path / "module.yaml"
     try:
         with open(module_yaml, 'r', encoding='utf-8') as f:
-            manifest = yaml.safe_load(f)
+            manifest = yaml.load(f, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         errors.append(f"Invalid YAML in module.yaml: {e}")
         return False, errors, warnings
@@ -295,6 +336,8 @@ def _validate_v2_format(module_path: Path) -> tuple[bool, list[str], list[str]]:
 
 def _validate_new_format(module_path: Path) -> tuple[bool, list[str], list[str]]:
     """Validate v1 format (MODULE.md + schema.json)."""
+    import yaml
+    from .loader import _YamlLoader
     errors = []
     warnings = []
     
@@ -316,7 +359,7 @@ def _validate_new_format(module_path: Path) -> tuple[bool, list[str], list[str]]
             if len(parts) < 3:
                 errors.append("MODULE.md frontmatter not properly closed")
             else:
-                frontmatter = yaml.safe_load(parts[1])
+                frontmatter = yaml.load(parts[1], Loader=_YamlLoader)
                 body = parts[2].strip()
                 
                 # Check required fields
@@ -382,6 +425,8 @@ def _validate_new_format(module_path: Path) -> tuple[bool, list[str], list[str]]
 
 def _validate_old_format(module_path: Path) -> tuple[bool, list[str], list[str]]:
     """Validate v0 format (6 files)."""
+    import yaml
+    from .loader import _YamlLoader
     errors = []
     warnings = []
     
@@ -426,7 +471,7 @@ def _validate_old_format(module_path: Path) -> tuple[bool, list[str], list[str]]
             if len(parts) < 3:
                 errors.append("module.md frontmatter not properly closed")
             else:
-                frontmatter = yaml.safe_load(parts[1])
+                frontmatter = yaml.load(parts[1], Loader=_YamlLoader)
                 required_fields = ['name', 'version', 'responsibility', 'excludes']
                 for field in required_fields:
                     if field not in frontmatter:
@@ -465,40 +510,44 @@ def _validate_examples(
     # Validate examples against schema if both exist
     if schema_path.exists():
         try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
-            
+            schema = _json.loads(schema_path.read_bytes())
+
             # Validate input example
             input_example_path = examples_path / "input.json"
             if input_example_path.exists() and "input" in schema:
-                with open(input_example_path, 'r', encoding='utf-8') as f:
-                    input_example = json.load(f)
-                try:
-                    jsonschema.validate(instance=input_example, schema=schema["input"])
-                except jsonschema.ValidationError as e:
-                    errors.append(f"Example input fails schema: {e.message}")
-            
+                input_example = _json.loads(input_example_path.read_bytes())
+                validator = build_schema_validator(schema["input"])
+                if validator is not None and not validator.is_valid(input_example):
+                    msg = _first_schema_error(validator, input_example)
+                    errors.append(f"Example input fails schema: {msg}")
+
             # Validate output example
             output_example_path = examples_path / "output.json"
             output_schema = schema.get("output", schema.get("data"))
             if output_example_path.exists() and output_schema:
-                with open(output_example_path, 'r', encoding='utf-8') as f:
-                    output_example = json.load(f)
-                try:
-                    jsonschema.validate(instance=output_example, schema=output_schema)
-                except jsonschema.ValidationError as e:
-                    errors.append(f"Example output fails schema: {e.message}")
-                
+                output_example = _json.loads(output_example_path.read_bytes())
+                validator = build_schema_validator(output_schema)
+                if validator is not None and not validator.is_valid(output_example):
+                    msg = _first_schema_error(validator, output_example)
+                    errors.append(f"Example output fails schema: {msg}")
+
                 # Check confidence
                 if "confidence" in output_example:
                     conf = output_example["confidence"]
                     if not (0 <= conf <= 1):
                         errors.append(f"Confidence must be 0-1, got: {conf}")
-                        
+
         except (json.JSONDecodeError, KeyError):
             pass
 
 
+def _first_schema_error(validator, instance) -> Optional[str]:
+    """Return the first validation error message for instance, if any."""
+    for e in validator.iter_errors(instance):
+        return e.message
+    return None
+
+
 def validate_v22_envelope(response: dict) -> tuple[bool, list[str]]:
     """
     Validate a response against v2.2 envelope format.
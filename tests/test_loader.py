@@ -132,3 +132,25 @@ class TestLoadModule:
         module = load_module(tmp_path)
         assert module["format"] == "v1"
         assert module["name"] == "auto-test"
+
+    def test_load_is_cached_until_module_changes(self, tmp_path):
+        (tmp_path / "MODULE.md").write_text("---\nname: cache-test\nversion: 1.0.0\n---\nContent")
+        (tmp_path / "schema.json").write_text("{}")
+
+        first = load_module(tmp_path)
+        second = load_module(tmp_path)
+        assert second["version"] == first["version"]
+
+        # Editing a file invalidates the cached entry
+        (tmp_path / "MODULE.md").write_text("---\nname: cache-test\nversion: 2.0.0\n---\nContent")
+        reloaded = load_module(tmp_path)
+        assert reloaded["version"] == "2.0.0"
+
+    def test_cache_clear_hook(self, tmp_path):
+        (tmp_path / "MODULE.md").write_text("---\nname: clear-test\n---\nContent")
+        (tmp_path / "schema.json").write_text("{}")
+
+        load_module(tmp_path)
+        load_module.cache_clear()
+        module = load_module(tmp_path)
+        assert module["name"] == "clear-test"
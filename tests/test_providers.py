@@ -0,0 +1,41 @@
+"""Tests for LLM providers and the response cache."""
+
+import pytest
+
+from cognitive.providers import llm_cache
+
+
+class TestLLMCache:
+    """Test the content-addressed response cache."""
+
+    def test_cache_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("LLM_CACHE", raising=False)
+        assert llm_cache.cache_enabled() is False
+
+    def test_cache_enabled_via_env(self, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE", "1")
+        assert llm_cache.cache_enabled() is True
+
+    def test_key_is_stable_and_content_addressed(self):
+        key1 = llm_cache.cache_key("openai", "gpt-4o", "prompt")
+        key2 = llm_cache.cache_key("openai", "gpt-4o", "prompt")
+        key3 = llm_cache.cache_key("openai", "gpt-4o", "other prompt")
+        assert key1 == key2
+        assert key1 != key3
+
+    def test_set_and_get_roundtrip(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(llm_cache, "CACHE_DIR", tmp_path)
+        key = llm_cache.cache_key("stub", None, "hello")
+        llm_cache.set(key, '{"ok": true}')
+        assert llm_cache.get(key) == '{"ok": true}'
+
+    def test_get_missing_returns_none(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(llm_cache, "CACHE_DIR", tmp_path)
+        assert llm_cache.get("no-such-key") is None
+
+    def test_expired_entry_is_dropped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(llm_cache, "CACHE_DIR", tmp_path)
+        monkeypatch.setenv("LLM_CACHE_TTL", "0")
+        key = llm_cache.cache_key("stub", None, "hello")
+        llm_cache.set(key, "response")
+        assert llm_cache.get(key) is None